@@ -0,0 +1,187 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Balance Harness Module
+
+Runs seeded Monte Carlo battles for every class x enemy x level cell and
+reports win rates and battle lengths with 95% confidence intervals.
+
+Each cell's battles are split into chunks of CHUNK_SIZE, and each chunk
+gets its own random.Random seeded from (seed, class, enemy, level, chunk).
+Chunks are independent, so they spread evenly over a process pool and
+the results are the same for any number of workers.
+
+Usage: python balance_harness.py [--levels 1-10] [--battles 10000] [--workers N]
+"""
+
+import argparse
+import csv
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import character_manager
+import combat_system
+
+CHUNK_SIZE = 2000
+DEFAULT_SEED = 163
+Z_95 = 1.96
+
+# ============================================================================
+# RUNNING BATTLES
+# ============================================================================
+
+def run_balance_sweep(levels, battles=10000, seed=DEFAULT_SEED, workers=None,
+                      action=combat_system.ABILITY, max_turns=100, classes=None, enemy_types=None):
+    """
+    Run `battles` battles for every (class, enemy_type, level) cell
+    classes and enemy_types default to every class and enemy in the game.
+    Returns a list of cell summaries (see summarize_cell) in cell order.
+    Raises ValueError if battles is less than 1.
+    """
+    if battles < 1:
+        raise ValueError(f"Need at least 1 battle per cell, got {battles}")
+    classes = classes or character_manager.get_class_names()
+    enemy_types = enemy_types or combat_system.get_enemy_types()
+    cells = [(character_class, enemy_type, level)
+             for character_class in classes for enemy_type in enemy_types for level in levels]
+
+    tasks = []
+    for cell in cells:
+        for chunk, start in enumerate(range(0, battles, CHUNK_SIZE)):
+            tasks.append((cell, chunk, min(CHUNK_SIZE, battles - start), seed, action, max_turns))
+
+    if workers == 1:
+        results = [run_chunk(task) for task in tasks]
+    else:
+        # Hand each worker a few batches of tasks to keep pickling overhead low
+        batch = max(1, len(tasks) // (4 * (workers or os.cpu_count() or 1)))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run_chunk, tasks, chunksize=batch))
+
+    totals = {cell: [0, 0, 0, 0, 0] for cell in cells}
+    for (cell, *_), counts in zip(tasks, results):
+        for index, value in enumerate(counts):
+            totals[cell][index] += value
+
+    return [summarize_cell(cell, *totals[cell]) for cell in cells]
+
+def run_chunk(task):
+    """
+    Run one chunk of a cell's battles (runs inside a worker process)
+    Returns (battles, wins, draws, turn total, squared turn total).
+    """
+    (character_class, enemy_type, level), chunk, count, seed, action, max_turns = task
+    rng = random.Random(f"{seed}:{character_class}:{enemy_type}:{level}:{chunk}")
+
+    character = make_character(character_class, level)
+    enemy = combat_system.create_enemy(enemy_type)
+    result = combat_system.simulate_battles([character] * count, [enemy] * count, action, rng, max_turns)
+
+    wins = result['winner'].count(combat_system.PLAYER_WON)
+    draws = result['winner'].count(combat_system.DRAW)
+    turns = result['turns']
+    return count, wins, draws, sum(turns), sum(t * t for t in turns)
+
+def make_character(character_class, level):
+    """Create a character of a class and level with the normal stat growth"""
+    character = character_manager.create_character(f"{character_class}{level}", character_class)
+    character['experience'] = character_manager.get_total_experience(level)
+    character_manager.apply_level_ups(character)
+    return character
+
+# ============================================================================
+# STATISTICS
+# ============================================================================
+
+def summarize_cell(cell, battles, wins, draws, turn_total, turn_squares):
+    """Build a cell summary with 95% confidence intervals"""
+    character_class, enemy_type, level = cell
+    mean_turns = turn_total / battles
+    variance = max(0.0, turn_squares / battles - mean_turns ** 2)
+    turn_margin = Z_95 * math.sqrt(variance / battles)
+    low, high = wilson_interval(wins, battles)
+    return {
+        'class': character_class,
+        'enemy': enemy_type,
+        'level': level,
+        'battles': battles,
+        'win_rate': wins / battles,
+        'win_low': low,
+        'win_high': high,
+        'draw_rate': draws / battles,
+        'mean_turns': mean_turns,
+        'turns_low': mean_turns - turn_margin,
+        'turns_high': mean_turns + turn_margin
+    }
+
+def wilson_interval(successes, trials, z=Z_95):
+    """Wilson score interval for a proportion (stays inside 0-1 near 0% and 100%)"""
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def format_summary_table(summaries):
+    """Format cell summaries as a text table"""
+    lines = [
+        f"{'Class':<8} {'Enemy':<8} {'Lvl':>3} | {'Win rate':>8} {'95% CI':>15} | {'Turns':>6} {'95% CI':>15} | {'Draws':>6}",
+        "-" * 86
+    ]
+    for s in summaries:
+        lines.append(
+            f"{s['class']:<8} {s['enemy']:<8} {s['level']:>3} | {s['win_rate']:>8.1%} "
+            f"{s['win_low']:>6.1%} - {s['win_high']:>6.1%} | {s['mean_turns']:>6.2f} "
+            f"{s['turns_low']:>6.2f} - {s['turns_high']:>6.2f} | {s['draw_rate']:>6.1%}")
+    return "\n".join(lines)
+
+def write_summary_csv(summaries, filename):
+    """Write cell summaries to a CSV file"""
+    with open(filename, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(summaries[0].keys()) if summaries else [])
+        writer.writeheader()
+        writer.writerows(summaries)
+
+def parse_battle_count(text):
+    """argparse type for --battles: a whole number of at least 1"""
+    battles = int(text)
+    if battles < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return battles
+
+def parse_level_range(text):
+    """Parse "4" or "1-10" into a list of levels"""
+    first, separator, last = text.partition("-")
+    if not separator:
+        return [int(first)]
+    return list(range(int(first), int(last) + 1))
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Win rates for every class x enemy x level")
+    parser.add_argument("--levels", default="1-10", help="A level or range, e.g. 4 or 1-10")
+    parser.add_argument("--battles", type=parse_battle_count, default=10000, help="Battles per cell")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--policy", choices=[combat_system.ATTACK, combat_system.ABILITY], default=combat_system.ABILITY)
+    parser.add_argument("--max-turns", type=int, default=100)
+    parser.add_argument("--classes", nargs="*")
+    parser.add_argument("--enemies", nargs="*")
+    parser.add_argument("--csv", help="Also write the table to this CSV file")
+    args = parser.parse_args()
+
+    summaries = run_balance_sweep(parse_level_range(args.levels), args.battles, args.seed, args.workers,
+                                  args.policy, args.max_turns, args.classes, args.enemies)
+    print(format_summary_table(summaries))
+    if args.csv:
+        write_summary_csv(summaries, args.csv)
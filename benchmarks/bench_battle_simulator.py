@@ -0,0 +1,53 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: one-by-one headless battles vs the lockstep batch simulator
+
+Runs the same class x enemy matchups with simulate_battle (one SimpleBattle
+per matchup) and with simulate_battles (all matchups in lockstep) and
+reports battles per second.
+
+Usage: python benchmarks/bench_battle_simulator.py [--battles 100000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import combat_system
+
+def make_matchups(count):
+    classes = character_manager.get_class_names()
+    enemy_types = ["goblin", "orc", "dragon"]
+    specs = [(f"Hero{i}", classes[i % len(classes)]) for i in range(count)]
+    characters = character_manager.create_characters(specs)
+    enemies = [combat_system.create_enemy(enemy_types[i % len(enemy_types)]) for i in range(count)]
+    return characters, enemies
+
+def run(count):
+    characters, enemies = make_matchups(count)
+    policy = combat_system.AbilityFirstPolicy()
+
+    rng = random.Random(163)
+    start = time.perf_counter()
+    for character, enemy in zip(characters, enemies):
+        combat_system.simulate_battle(character, enemy, policy, rng)
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    combat_system.simulate_battles(characters, enemies, combat_system.ABILITY, random.Random(163))
+    batch_time = time.perf_counter() - start
+
+    print(f"{count} battles (ability-first policy)")
+    print(f"one by one: {single_time:6.2f}s ({count / single_time:>10,.0f} battles/s)")
+    print(f"lockstep:   {batch_time:6.2f}s ({count / batch_time:>10,.0f} battles/s, {single_time / batch_time:.1f}x)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Battle simulator benchmark")
+    parser.add_argument("--battles", type=int, default=100000)
+    args = parser.parse_args()
+    run(args.battles)
@@ -0,0 +1,66 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: memory per resident character
+
+Builds the same characters as plain dicts and as slotted Character objects
+and reports the memory each one takes (measured with tracemalloc), plus the
+projected total for 1,000,000 resident characters.
+
+Usage: python benchmarks/bench_character_memory.py [--characters 200000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+def make_fields(count):
+    """Build the field values up front so both runs share the same strings"""
+    classes = ["Warrior", "Mage", "Rogue", "Cleric"]
+    names = [f"Hero{i}" for i in range(count)]
+    return [
+        {
+            "name": names[i], "class": classes[i % 4], "level": 1 + i % 50,
+            "health": 100, "max_health": 100, "strength": 10, "magic": 10,
+            "experience": i % 100, "gold": i % 5000,
+        }
+        for i in range(count)
+    ]
+
+def measure(build, field_list):
+    """Return bytes allocated per character by build(fields)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    characters = []
+    for fields in field_list:
+        characters.append(build(fields))
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(field_list)
+
+def build_dict(fields):
+    return dict(fields, inventory=[], active_quests=[], completed_quests=[])
+
+def build_slotted(fields):
+    return character_manager.Character(fields, inventory=[], active_quests=[], completed_quests=[])
+
+def run(count):
+    field_list = make_fields(count)
+    print(f"{count} characters")
+    print(f"{'Type':<10} | {'Bytes/char':>10} | {'1M chars':>10}")
+    print("-" * 38)
+    for label, build in [("dict", build_dict), ("Character", build_slotted)]:
+        per_character = measure(build, field_list)
+        print(f"{label:<10} | {per_character:>10.0f} | {per_character * 1_000_000 / 2**20:>8.0f}MB")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-character memory benchmark")
+    parser.add_argument("--characters", type=int, default=200000)
+    args = parser.parse_args()
+    run(args.characters)
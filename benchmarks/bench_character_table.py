@@ -0,0 +1,71 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: per-character updates vs CharacterTable
+
+Applies one simulation tick (experience, gold, healing and revives) to the
+same population twice: by looping over Character objects with the
+single-character functions, and with the CharacterTable column methods.
+
+Usage: python benchmarks/bench_character_table.py [--characters 200000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+def make_characters(count):
+    rng = random.Random(163)
+    classes = ["Warrior", "Mage", "Rogue", "Cleric"]
+    characters = []
+    for i in range(count):
+        char = character_manager.create_character(f"Hero{i}", classes[i % 4])
+        char['health'] = rng.randint(-10, char['max_health'])
+        characters.append(char)
+    return characters
+
+def tick_characters(characters, xp, gold):
+    for char, xp_amount, gold_amount in zip(characters, xp, gold):
+        if not character_manager.is_character_dead(char):
+            character_manager.gain_experience(char, xp_amount)
+        character_manager.add_gold(char, gold_amount)
+        character_manager.heal_character(char, 5)
+        character_manager.revive_character(char)
+
+def tick_table(table, xp, gold):
+    table.gain_experience(xp)
+    table.add_gold(gold)
+    table.heal(None, 5)
+    table.revive_dead()
+
+def run(count):
+    rng = random.Random(1)
+    xp = [rng.randint(0, 150) for _ in range(count)]
+    gold = [rng.randint(0, 20) for _ in range(count)]
+
+    characters = make_characters(count)
+    table = character_manager.CharacterTable(characters)
+
+    start = time.perf_counter()
+    tick_characters(characters, xp, gold)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tick_table(table, xp, gold)
+    table_time = time.perf_counter() - start
+
+    assert table.to_characters() == characters
+    print(f"{count} characters, one tick")
+    print(f"per-character loop: {loop_time * 1000:8.1f}ms")
+    print(f"CharacterTable:     {table_time * 1000:8.1f}ms ({loop_time / table_time:.1f}x)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CharacterTable benchmark")
+    parser.add_argument("--characters", type=int, default=200000)
+    args = parser.parse_args()
+    run(args.characters)
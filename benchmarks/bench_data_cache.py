@@ -0,0 +1,80 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: cold parse vs warm compiled cache
+
+Generates synthetic quest and item catalogs and times how long it takes to
+load them by parsing the text file versus loading the compiled cache.
+
+Usage: python benchmarks/bench_data_cache.py [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+
+def write_quest_catalog(filename, count):
+    """Write count quest blocks to filename"""
+    with open(filename, 'w') as f:
+        for i in range(count):
+            prereq = f"quest_{i - 1}" if i else "NONE"
+            f.write(f"QUEST_ID: quest_{i}\n")
+            f.write(f"TITLE: Quest {i}\n")
+            f.write(f"DESCRIPTION: Generated quest number {i}\n")
+            f.write(f"REWARD_XP: {50 + i % 500}\n")
+            f.write(f"REWARD_GOLD: {25 + i % 250}\n")
+            f.write(f"REQUIRED_LEVEL: {1 + i % 50}\n")
+            f.write(f"PREREQUISITE: {prereq}\n\n")
+
+def write_item_catalog(filename, count):
+    """Write count item blocks to filename"""
+    types = ["consumable", "weapon", "armor"]
+    stats = ["health", "strength", "max_health"]
+    with open(filename, 'w') as f:
+        for i in range(count):
+            f.write(f"ITEM_ID: item_{i}\n")
+            f.write(f"NAME: Item {i}\n")
+            f.write(f"TYPE: {types[i % 3]}\n")
+            f.write(f"EFFECT: {stats[i % 3]}:{1 + i % 40}\n")
+            f.write(f"COST: {10 + i % 1000}\n")
+            f.write(f"DESCRIPTION: Generated item number {i}\n\n")
+
+def time_call(func, *args):
+    """Return (seconds, result) for one call"""
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+def run(sizes):
+    workdir = tempfile.mkdtemp(prefix="qc_bench_")
+    try:
+        print(f"{'Catalog':<8} | {'Blocks':>9} | {'Cold parse':>11} | {'Warm cache':>11} | {'Speedup':>8}")
+        print("-" * 60)
+        for count in sizes:
+            for label, writer, loader in [
+                ("quests", write_quest_catalog, game_data.load_quests),
+                ("items", write_item_catalog, game_data.load_items),
+            ]:
+                filename = os.path.join(workdir, f"{label}_{count}.txt")
+                writer(filename, count)
+
+                # Cold: no cache on disk, so this parses and writes the cache
+                cold, data = time_call(game_data.load_with_cache, filename, loader)
+                warm, cached = time_call(game_data.load_with_cache, filename, loader)
+                assert len(cached) == len(data) == count
+
+                print(f"{label:<8} | {count:>9} | {cold:>10.3f}s | {warm:>10.3f}s | {cold / warm:>7.1f}x")
+    finally:
+        shutil.rmtree(workdir)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cold parse vs warm cache startup benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    args = parser.parse_args()
+    run(args.sizes)
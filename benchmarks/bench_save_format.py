@@ -0,0 +1,103 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Benchmark: text vs binary character saves
+
+Saves and loads the same characters in a text-format and a binary-format
+save directory and reports time per character and file size.
+
+Usage: python benchmarks/bench_save_format.py [--characters 2000]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+def make_characters(count):
+    """Build characters with a full inventory and some quest history"""
+    classes = ["Warrior", "Mage", "Rogue", "Cleric"]
+    characters = []
+    for i in range(count):
+        char = character_manager.create_character(f"Bench{i}", classes[i % 4])
+        char['level'] = 1 + i % 50
+        char['experience'] = i % 100
+        char['gold'] = i * 7
+        char['inventory'] = [f"item_{j}" for j in range(20)]
+        char['active_quests'] = [f"quest_{j}" for j in range(3)]
+        char['completed_quests'] = [f"quest_{j}" for j in range(3, 15)]
+        characters.append(char)
+    return characters
+
+def run_format(save_format, characters, workdir):
+    """Return (save seconds, load seconds, total bytes) for one format"""
+    save_dir = os.path.join(workdir, save_format)
+    character_manager.configure_save_directory(save_dir, format=save_format)
+
+    start = time.perf_counter()
+    for char in characters:
+        character_manager.save_character(char, save_dir)
+    save_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for char in characters:
+        character_manager.load_character(char['name'], save_dir)
+    load_time = time.perf_counter() - start
+
+    total_bytes = 0
+    for filename in os.listdir(save_dir):
+        if filename != character_manager.SAVE_CONFIG_FILENAME:
+            total_bytes += os.path.getsize(os.path.join(save_dir, filename))
+    return save_time, load_time, total_bytes
+
+def run_codec(save_format, characters):
+    """Return (encode seconds, decode seconds) without any file I/O"""
+    if save_format == "binary":
+        encode = character_manager.encode_binary_save
+        decode = character_manager.decode_binary_save
+    else:
+        encode = character_manager.encode_text_save
+        decode = lambda data: character_manager.decode_text_save(data.decode("utf-8"))
+
+    start = time.perf_counter()
+    encoded = [encode(char) for char in characters]
+    encode_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for data in encoded:
+        decode(data)
+    decode_time = time.perf_counter() - start
+    return encode_time, decode_time
+
+def run(count):
+    characters = make_characters(count)
+    workdir = tempfile.mkdtemp(prefix="qc_bench_")
+    try:
+        print(f"{count} characters")
+        print(f"{'Format':<8} | {'Save/char':>10} | {'Load/char':>10} | {'Bytes/char':>10}")
+        print("-" * 48)
+        for save_format in ["text", "binary"]:
+            save_time, load_time, total_bytes = run_format(save_format, characters, workdir)
+            print(f"{save_format:<8} | {save_time / count * 1e6:>8.1f}us | "
+                  f"{load_time / count * 1e6:>8.1f}us | {total_bytes / count:>10.0f}")
+
+        print()
+        print("Encode/decode only (no file I/O)")
+        print(f"{'Format':<8} | {'Encode/char':>11} | {'Decode/char':>11}")
+        print("-" * 36)
+        for save_format in ["text", "binary"]:
+            encode_time, decode_time = run_codec(save_format, characters)
+            print(f"{save_format:<8} | {encode_time / count * 1e6:>9.2f}us | {decode_time / count * 1e6:>9.2f}us")
+    finally:
+        shutil.rmtree(workdir)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Text vs binary save format benchmark")
+    parser.add_argument("--characters", type=int, default=2000)
+    args = parser.parse_args()
+    run(args.characters)
@@ -9,55 +9,239 @@ This module handles character creation, loading, and saving.
 """
 
 import os
+import queue
+import itertools
+import sqlite3
+import struct
+import sys
+import threading
+import time
+import zlib
+from array import array
+from bisect import bisect_right
+from math import isqrt
+from collections import Counter
+from collections.abc import MutableMapping
+from contextlib import contextmanager, nullcontext
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import game_data
 from custom_exceptions import (
     InvalidCharacterClassError,
+    MissingDataFileError,
     CharacterNotFoundError,
     SaveFileCorruptedError,
     InvalidSaveDataError,
     CharacterDeadError
 )
 
+# Fields written to and read from save files
+SAVE_FIELDS = [
+    "name", "class", "level", "health", "max_health",
+    "strength", "magic", "experience", "gold", "inventory",
+    "active_quests", "completed_quests"
+]
+
+# Every field a Character can hold. The equipped slots are optional and are
+# not saved.
+CHARACTER_FIELDS = SAVE_FIELDS + ["equipped_weapon", "equipped_armor"]
+
+# Last saved/loaded state of each character, keyed by save path. Used to tell
+# whether a character changed since it was last written.
+saved_snapshots = {}
+
+# Per-directory save settings live in save_config.txt as "KEY: value" lines.
+# BACKEND: text stores one save file per character (the default);
+# any other name is looked up in SAVE_BACKENDS (e.g. BACKEND: sqlite).
+# FORMAT: text writes <name>_save.txt (the default), FORMAT: binary writes
+# the compact <name>_save.bin. Loading detects the format from the file.
+# MODE: snapshot rewrites the whole save file on every save (the default).
+# MODE: log appends change records to <name>_save.log and only rewrites the
+# snapshot every LOG_COMPACT_THRESHOLD records.
+SAVE_CONFIG_FILENAME = "save_config.txt"
+DEFAULT_SAVE_SETTINGS = {"backend": "text", "format": "text", "mode": "snapshot"}
+LOG_COMPACT_THRESHOLD = 200
+save_settings_cache = {}
+
+# Save manifest: per-character summaries for the character-select menu, kept
+# in save_manifest.txt so listing does not open every save. See
+# list_character_summaries().
+MANIFEST_FILENAME = "save_manifest.txt"
+MANIFEST_HEADER = "QC_MANIFEST 1"
+SUMMARY_FIELDS = ["name", "class", "level", "gold"]
+manifest_lock = threading.Lock()
+manifest_updates = {}
+
+# Binary save layout (see encode_binary_save). Version 2 added the
+# checksum footer; version 1 saves are still read.
+BINARY_SAVE_MAGIC = b"QCSB"
+BINARY_SAVE_VERSION = 2
+BINARY_HEADER = struct.Struct("<4sH")
+BINARY_STATS = struct.Struct("<8q")
+BINARY_LENGTH = struct.Struct("<I")
+BINARY_LIST_HEADER = struct.Struct("<II")
+BINARY_CHECKSUM = struct.Struct("<I")
+
+# Save files end with a CRC32 of everything before it: a "CHECKSUM: xxxxxxxx"
+# line in text saves, 4 bytes in binary saves. Saves written before
+# checksums existed have no footer and are still accepted.
+TEXT_CHECKSUM_PREFIX = b"CHECKSUM: "
+VERIFY_CHUNK_SIZE = 512
+
+# Leveling: going from level L to L + 1 costs L * XP_PER_LEVEL experience.
+# LEVEL_XP_TABLE[L - 1] is the total experience needed to reach level L
+# from level 1, so a level is found with one binary search. Levels past the
+# table use the closed form of the same sum.
+XP_PER_LEVEL = 100
+LEVEL_TABLE_SIZE = 1000
+LEVEL_XP_TABLE = array('q', [XP_PER_LEVEL * level * (level - 1) // 2
+                             for level in range(1, LEVEL_TABLE_SIZE + 1)])
+
+# Called as listener(character, old_level, new_level) after a level up
+level_up_listeners = []
+
+# Change log state per character (same keys as saved_snapshots):
+# {'log_id': id written in the snapshot and log header, 'records': count}
+log_states = {}
+
 # ============================================================================
 # CHARACTER MANAGEMENT FUNCTIONS
 # ============================================================================
 
+class Character(MutableMapping):
+    """
+    A character's fields stored in __slots__ instead of a per-character dict
+    Supports the same access as the old character dicts (character['health'],
+    .get(), 'equipped_weapon' in character, dict(character)), and
+    character.health works too. Setting a field that is not in
+    CHARACTER_FIELDS raises KeyError, so typos are caught.
+    """
+
+    __slots__ = tuple(CHARACTER_FIELDS)
+
+    def __init__(self, fields=(), **kwargs):
+        for key, value in dict(fields, **kwargs).items():
+            self[key] = value
+
+    def __getitem__(self, key):
+        if key not in CHARACTER_FIELD_SET:
+            raise KeyError(key)  # Not a method or other attribute of the object
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        if key not in CHARACTER_FIELD_SET:
+            raise KeyError(f"Unknown character field: {key}")
+        setattr(self, key, value)
+
+    def __delitem__(self, key):
+        if key not in CHARACTER_FIELD_SET:
+            raise KeyError(key)
+        try:
+            delattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return key in CHARACTER_FIELD_SET and hasattr(self, key)
+
+    def __iter__(self):
+        for key in CHARACTER_FIELDS:
+            if hasattr(self, key):
+                yield key
+
+    def __len__(self):
+        return sum(1 for key in self)
+
+    def get(self, key, default=None):
+        if key in CHARACTER_FIELD_SET:
+            return getattr(self, key, default)
+        return default
+
+    def copy(self):
+        return Character(self)
+
+    def __repr__(self):
+        return f"Character({dict(self)!r})"
+
+CHARACTER_FIELD_SET = frozenset(CHARACTER_FIELDS)
+
+# Character classes are read from CLASSES_FILENAME (see game_data.load_classes)
+# the first time a character is created; DEFAULT_CLASSES is used when the
+# file does not exist. Each class is compiled into a prototype: a tuple of
+# the starting values of PROTOTYPE_FIELDS, which new characters copy.
+CLASSES_FILENAME = "data/classes.txt"
+DEFAULT_CLASSES = {
+    "Warrior": {"class_id": "Warrior", "health": 120, "strength": 15, "magic": 5, "gold": 100},
+    "Mage": {"class_id": "Mage", "health": 80, "strength": 8, "magic": 20, "gold": 100},
+    "Rogue": {"class_id": "Rogue", "health": 90, "strength": 12, "magic": 10, "gold": 100},
+    "Cleric": {"class_id": "Cleric", "health": 100, "strength": 10, "magic": 15, "gold": 100}
+}
+PROTOTYPE_FIELDS = ("class", "level", "health", "max_health", "strength", "magic", "experience", "gold")
+class_prototypes = None
+
 def create_character(name, character_class):
     """
     Create a new character with stats based on class
     """
-    valid_classes = {
-        "Warrior": {"health": 120, "max_health": 120, "strength": 15, "magic": 5},
-        "Mage": {"health": 80, "max_health": 80, "strength": 8, "magic": 20},
-        "Rogue": {"health": 90, "max_health": 90, "strength": 12, "magic": 10},
-        "Cleric": {"health": 100, "max_health": 100, "strength": 10, "magic": 15}
-    }
+    return clone_prototype(name, get_class_prototype(character_class))
+
+def create_characters(specs):
+    """
+    Create many characters from (name, class) pairs
+    Every class is checked before any character is built.
+    """
+    specs = list(specs)
+    prototypes = [get_class_prototype(character_class) for name, character_class in specs]
+    return [clone_prototype(name, prototype) for (name, character_class), prototype in zip(specs, prototypes)]
+
+def clone_prototype(name, prototype):
+    """Build a new Character from a class prototype"""
+    character = Character()
+    character.name = name
+    for field, value in zip(PROTOTYPE_FIELDS, prototype):
+        setattr(character, field, value)
+    character.inventory = []
+    character.active_quests = []
+    character.completed_quests = []
+    return character
 
-    if character_class not in valid_classes:
-        valid_list = list(valid_classes.keys())
+def get_class_prototype(character_class):
+    prototypes = class_prototypes if class_prototypes is not None else load_class_prototypes()
+    prototype = prototypes.get(character_class)
+    if prototype is None:
+        valid_list = list(prototypes.keys())
         raise InvalidCharacterClassError(f"Class '{character_class}' is not valid. Choose from: {valid_list}")
+    return prototype
 
-    base_stats = valid_classes[character_class]
+def get_class_names():
+    """Get the names of every playable class"""
+    if class_prototypes is None:
+        load_class_prototypes()
+    return list(class_prototypes.keys())
 
-    character = {
-        "name": name,
-        "class": character_class,
-        "level": 1,
-        "health": base_stats["health"],
-        "max_health": base_stats["max_health"],
-        "strength": base_stats["strength"],
-        "magic": base_stats["magic"],
-        "experience": 0,
-        "gold": 100,
-        "inventory": [],
-        "active_quests": [],
-        "completed_quests": []
-    }
+def load_class_prototypes(filename=None):
+    """
+    (Re)load the class catalog and compile it into prototypes
+    Raises InvalidDataFormatError if the classes file is malformed.
+    """
+    global class_prototypes
+    try:
+        classes = game_data.load_classes(filename or CLASSES_FILENAME)
+    except MissingDataFileError:
+        classes = DEFAULT_CLASSES
 
-    return character
+    class_prototypes = {
+        class_id: (class_id, 1, stats['health'], stats['health'], stats['strength'], stats['magic'], 0, stats['gold'])
+        for class_id, stats in classes.items()
+    }
+    return class_prototypes
 
 def save_character(character, save_directory="data/save_games"):
     """
     Save character to file
+    In log mode only the changes since the last save are appended.
     """
     if not os.path.exists(save_directory):
         try:
@@ -65,103 +249,359 @@ def save_character(character, save_directory="data/save_games"):
         except OSError as e:
             raise IOError(f"Could not create directory {save_directory}: {e}")
 
-    filename = f"{character['name']}_save.txt"
-    filepath = os.path.join(save_directory, filename)
+    store = get_save_store(save_directory)
+    if store is not None:
+        store.save(character)
+    else:
+        manifest_trusted = begin_manifest_update(save_directory)
+        record = None
+        try:
+            if get_save_settings(save_directory)["mode"] == "log":
+                save_character_changes(character, save_directory)
+            else:
+                filepath = write_character_snapshot(character, save_directory)
+                name = character['name']
+                run_after_commit(lambda: remove_character_log(name, save_directory), filepath=filepath)
+            record = encode_manifest_entry(get_character_summary(character))
+        finally:
+            finish_manifest_update(save_directory, manifest_trusted, record)
+    
+    mark_character_clean(character, save_directory)
+    return True
+
+def write_character_snapshot(character, save_directory, log_id=None, use_batch=True):
+    """
+    Write the full save file in the directory's FORMAT (text or binary)
+    log_id links the snapshot to the change log that continues it. A save
+    in the other format is removed so only one file exists per character.
+    The file is replaced atomically, so a crash leaves the old or the new
+    save, never a truncated one. Returns the path written.
+    """
+    text_path = os.path.join(save_directory, f"{character['name']}_save.txt")
+    binary_path = os.path.join(save_directory, f"{character['name']}_save.bin")
+
+    if get_save_settings(save_directory)["format"] == "binary":
+        filepath, stale_path = binary_path, text_path
+        data = encode_binary_save(character, log_id)
+    else:
+        filepath, stale_path = text_path, binary_path
+        data = encode_text_save(character, log_id)
 
     try:
-        with open(filepath, 'w') as f:
-            f.write(f"NAME: {character['name']}\n")
-            f.write(f"CLASS: {character['class']}\n")
-            f.write(f"LEVEL: {character['level']}\n")
-            f.write(f"HEALTH: {character['health']}\n")
-            f.write(f"MAX_HEALTH: {character['max_health']}\n")
-            f.write(f"STRENGTH: {character['strength']}\n")
-            f.write(f"MAGIC: {character['magic']}\n")
-            f.write(f"EXPERIENCE: {character['experience']}\n")
-            f.write(f"GOLD: {character['gold']}\n")
-            
-            inv_str = ",".join(character['inventory'])
-            active_q_str = ",".join(character['active_quests'])
-            comp_q_str = ",".join(character['completed_quests'])
-            
-            f.write(f"INVENTORY: {inv_str}\n")
-            f.write(f"ACTIVE_QUESTS: {active_q_str}\n")
-            f.write(f"COMPLETED_QUESTS: {comp_q_str}\n")
-            
+        write_file_atomic(filepath, data, 'wb', use_batch=use_batch)
+        run_after_commit(lambda: remove_file_if_exists(stale_path), use_batch, filepath)
     except PermissionError:
         raise PermissionError(f"Permission denied when writing to {filepath}")
     except IOError as e:
         raise IOError(f"Error saving character: {e}")
-    
-    return True
+    return filepath
+
+def encode_text_save(character, log_id=None):
+    """
+    Build the contents of a <name>_save.txt file as UTF-8 bytes
+    The checksum covers exactly these bytes, so they must be written in
+    binary mode (text mode may change line endings or the encoding).
+    """
+    inv_str = ",".join(character['inventory'])
+    active_q_str = ",".join(character['active_quests'])
+    comp_q_str = ",".join(character['completed_quests'])
+
+    lines = [
+        f"NAME: {character['name']}",
+        f"CLASS: {character['class']}",
+        f"LEVEL: {character['level']}",
+        f"HEALTH: {character['health']}",
+        f"MAX_HEALTH: {character['max_health']}",
+        f"STRENGTH: {character['strength']}",
+        f"MAGIC: {character['magic']}",
+        f"EXPERIENCE: {character['experience']}",
+        f"GOLD: {character['gold']}",
+        f"INVENTORY: {inv_str}",
+        f"ACTIVE_QUESTS: {active_q_str}",
+        f"COMPLETED_QUESTS: {comp_q_str}"
+    ]
+    if log_id is not None:
+        lines.append(f"LOG_ID: {log_id}")
+    data = ("\n".join(lines) + "\n").encode("utf-8")
+    return data + f"CHECKSUM: {zlib.crc32(data):08x}\n".encode("ascii")
+
+def encode_binary_save(character, log_id=None):
+    """
+    Build the contents of a <name>_save.bin file
+    Layout: magic + version, the numeric stats packed as fixed-size integers
+    (log_id -1 = no change log), then name and class as length-prefixed
+    UTF-8 and each ID list as (count, byte length, NUL-joined IDs), then
+    the CRC32 of all of that.
+    """
+    parts = [
+        BINARY_HEADER.pack(BINARY_SAVE_MAGIC, BINARY_SAVE_VERSION),
+        BINARY_STATS.pack(
+            character['level'], character['health'], character['max_health'],
+            character['strength'], character['magic'], character['experience'],
+            character['gold'], -1 if log_id is None else log_id
+        )
+    ]
+    for text in (character['name'], character['class']):
+        encoded = text.encode()
+        parts.append(BINARY_LENGTH.pack(len(encoded)))
+        parts.append(encoded)
+    for field in ("inventory", "active_quests", "completed_quests"):
+        ids = character[field]
+        encoded = "\0".join(ids).encode()
+        parts.append(BINARY_LIST_HEADER.pack(len(ids), len(encoded)))
+        parts.append(encoded)
+    data = b"".join(parts)
+    return data + BINARY_CHECKSUM.pack(zlib.crc32(data))
+
+def save_character_if_dirty(character, save_directory="data/save_games"):
+    """
+    Save character only if it changed since it was last saved or loaded
+    Returns True if the file was written
+    """
+    if not is_character_dirty(character, save_directory):
+        return False
+    return save_character(character, save_directory)
 
 def load_character(character_name, save_directory="data/save_games"):
     """
     Load character from save file
     """
-    filename = f"{character_name}_save.txt"
-    filepath = os.path.join(save_directory, filename)
+    store = get_save_store(save_directory)
+    if store is not None:
+        character = store.load(character_name)
+    else:
+        character = load_file_character(character_name, save_directory)
+
+    mark_character_clean(character, save_directory)
+    return character
+
+def list_saved_characters(save_directory="data/save_games"):
+    """
+    Get list of all saved character names
+    """
+    store = get_save_store(save_directory)
+    if store is not None:
+        return store.list_names()
+    return list_file_characters(save_directory)
 
-    if not os.path.exists(filepath):
+def delete_character(character_name, save_directory="data/save_games"):
+    """
+    Delete a character's save
+    """
+    store = get_save_store(save_directory)
+    if store is not None:
+        store.delete(character_name)
+    else:
+        manifest_trusted = begin_manifest_update(save_directory)
+        record = None
+        try:
+            delete_file_character(character_name, save_directory)
+            record = f"DEL\t{character_name}"
+        finally:
+            finish_manifest_update(save_directory, manifest_trusted, record)
+
+    saved_snapshots.pop(get_snapshot_key(character_name, save_directory), None)
+    return True
+
+def find_save_file(character_name, save_directory="data/save_games"):
+    """Get the path of a character's binary or text save file, or None"""
+    for extension in (".bin", ".txt"):
+        filepath = os.path.join(save_directory, f"{character_name}_save{extension}")
+        if os.path.exists(filepath):
+            return filepath
+    return None
+
+def load_file_character(character_name, save_directory="data/save_games"):
+    """
+    Load character from its save file (plus change log)
+    The format is detected from the file, so text and binary saves can be
+    mixed in one directory.
+    """
+    filepath = find_save_file(character_name, save_directory)
+    if filepath is None:
         raise CharacterNotFoundError(f"No save file found for {character_name}")
+    filename = os.path.basename(filepath)
 
-    character = {}
-    
     try:
-        with open(filepath, 'r') as f:
-            lines = f.readlines()
-            
-        for line in lines:
-            if ":" not in line:
-                continue 
-            
-            parts = line.strip().split(":", 1)
-            if len(parts) != 2:
-                continue 
-            
-            key = parts[0].strip()
-            value = parts[1].strip()
-            
-            if key == "NAME":
-                character["name"] = value
-            elif key == "CLASS":
-                character["class"] = value
-            elif key == "LEVEL":
-                character["level"] = int(value)
-            elif key == "HEALTH":
-                character["health"] = int(value)
-            elif key == "MAX_HEALTH":
-                character["max_health"] = int(value)
-            elif key == "STRENGTH":
-                character["strength"] = int(value)
-            elif key == "MAGIC":
-                character["magic"] = int(value)
-            elif key == "EXPERIENCE":
-                character["experience"] = int(value)
-            elif key == "GOLD":
-                character["gold"] = int(value)
-            elif key == "INVENTORY": 
-                character["inventory"] = value.split(",") if value else []
-            elif key == "ACTIVE_QUESTS": 
-                character["active_quests"] = value.split(",") if value else []
-            elif key == "COMPLETED_QUESTS": 
-                character["completed_quests"] = value.split(",") if value else []
+        with open(filepath, 'rb') as f:
+            data = f.read()
+
+        status = check_save_checksum(data)
+        if status == "corrupt":
+            raise SaveFileCorruptedError(f"Checksum mismatch in {filename}.")
+        if status == "truncated":
+            raise SaveFileCorruptedError(f"{filename} ends before its checksum (truncated).")
+
+        if data.startswith(BINARY_SAVE_MAGIC):
+            character, log_id = decode_binary_save(data)
+        else:
+            character, log_id = decode_text_save(data.decode("utf-8"))
+
+        if log_id is not None:
+            log_path = os.path.join(save_directory, f"{character_name}_save.log")
+            records = replay_character_log(character, log_path, log_id)
+            log_states[get_snapshot_key(character_name, save_directory)] = {
+                'log_id': log_id, 'records': records
+            }
 
         validate_character_data(character)
-        return character
+        return Character(character)
 
-    except (ValueError, IndexError):
+    except (ValueError, IndexError, struct.error):
         raise InvalidSaveDataError(f"Data in {filename} is malformed.")
     except IOError:
         raise SaveFileCorruptedError(f"Could not read file {filename}.")
-    except InvalidSaveDataError:
+    except (InvalidSaveDataError, SaveFileCorruptedError):
         raise
     except Exception:
         raise SaveFileCorruptedError(f"Unexpected error loading {filename}")
 
-def list_saved_characters(save_directory="data/save_games"):
+def check_save_checksum(data):
     """
-    Get list of all saved character names
+    Check the checksum footer of a save file's bytes without parsing it
+    Returns "ok", "missing" (no footer: a save from before checksums, left
+    to parsing and validation), "corrupt" or "truncated" (the footer is cut
+    off).
+    """
+    if data.startswith(BINARY_SAVE_MAGIC):
+        if len(data) < BINARY_HEADER.size:
+            return "truncated"
+        magic, version = BINARY_HEADER.unpack_from(data, 0)
+        if version < 2:
+            return "missing"
+        expected_length = get_binary_save_length(data)
+        if expected_length is None or len(data) < expected_length + BINARY_CHECKSUM.size:
+            return "truncated"
+        body = data[:-BINARY_CHECKSUM.size]
+        (checksum,) = BINARY_CHECKSUM.unpack_from(data, len(body))
+    else:
+        footer_start = data.rfind(b"\n", 0, len(data) - 1) + 1
+        if not data.startswith(TEXT_CHECKSUM_PREFIX, footer_start):
+            return "missing"  # Parsing and validation decide if it is usable
+        if not data.endswith(b"\n"):
+            return "truncated"
+        body = data[:footer_start]
+        try:
+            checksum = int(data[footer_start + len(TEXT_CHECKSUM_PREFIX):], 16)
+        except ValueError:
+            return "corrupt"
+
+    return "ok" if zlib.crc32(body) == checksum else "corrupt"
+
+def get_binary_save_length(data):
+    """
+    Get the length a binary save's body should have by following its length
+    prefixes, or None if they run past the end of the data
+    """
+    try:
+        offset = BINARY_HEADER.size + BINARY_STATS.size
+        for _ in range(2):
+            (length,) = BINARY_LENGTH.unpack_from(data, offset)
+            offset += BINARY_LENGTH.size + length
+        for _ in range(3):
+            count, length = BINARY_LIST_HEADER.unpack_from(data, offset)
+            offset += BINARY_LIST_HEADER.size + length
+    except struct.error:
+        return None
+    return offset if offset <= len(data) else None
+
+def decode_text_save(text):
+    """Parse the contents of a text save into (character, log_id)"""
+    character = {}
+    log_id = None
+
+    for line in text.splitlines():
+        if ":" not in line:
+            continue 
+        
+        parts = line.strip().split(":", 1)
+        if len(parts) != 2:
+            continue 
+        
+        key = parts[0].strip()
+        value = parts[1].strip()
+        
+        if key == "NAME":
+            character["name"] = value
+        elif key == "CLASS":
+            character["class"] = value
+        elif key == "LEVEL":
+            character["level"] = int(value)
+        elif key == "HEALTH":
+            character["health"] = int(value)
+        elif key == "MAX_HEALTH":
+            character["max_health"] = int(value)
+        elif key == "STRENGTH":
+            character["strength"] = int(value)
+        elif key == "MAGIC":
+            character["magic"] = int(value)
+        elif key == "EXPERIENCE":
+            character["experience"] = int(value)
+        elif key == "GOLD":
+            character["gold"] = int(value)
+        elif key == "INVENTORY": 
+            character["inventory"] = value.split(",") if value else []
+        elif key == "ACTIVE_QUESTS": 
+            character["active_quests"] = value.split(",") if value else []
+        elif key == "COMPLETED_QUESTS": 
+            character["completed_quests"] = value.split(",") if value else []
+        elif key == "LOG_ID":
+            log_id = int(value)
+
+    return character, log_id
+
+def decode_binary_save(data):
+    """Parse the contents of a binary save into (character, log_id)"""
+    magic, version = BINARY_HEADER.unpack_from(data, 0)
+    if version not in (1, BINARY_SAVE_VERSION):
+        raise ValueError(f"Unsupported binary save version {version}")
+    offset = BINARY_HEADER.size
+
+    (level, health, max_health, strength, magic_stat,
+     experience, gold, log_id) = BINARY_STATS.unpack_from(data, offset)
+    offset += BINARY_STATS.size
+
+    texts = []
+    for _ in range(2):
+        (length,) = BINARY_LENGTH.unpack_from(data, offset)
+        offset += BINARY_LENGTH.size
+        texts.append(data[offset:offset + length].decode())
+        offset += length
+
+    lists = []
+    for _ in range(3):
+        count, length = BINARY_LIST_HEADER.unpack_from(data, offset)
+        offset += BINARY_LIST_HEADER.size
+        ids = data[offset:offset + length].decode().split("\0") if count else []
+        if len(ids) != count:
+            raise ValueError("ID list length does not match its count")
+        lists.append(ids)
+        offset += length
+
+    if version >= 2:
+        offset += BINARY_CHECKSUM.size  # Checked by check_save_checksum
+    if offset != len(data):
+        raise ValueError("Unexpected bytes after binary save")
+
+    character = {
+        "name": texts[0],
+        "class": texts[1],
+        "level": level,
+        "health": health,
+        "max_health": max_health,
+        "strength": strength,
+        "magic": magic_stat,
+        "experience": experience,
+        "gold": gold,
+        "inventory": lists[0],
+        "active_quests": lists[1],
+        "completed_quests": lists[2]
+    }
+    return character, (None if log_id < 0 else log_id)
+
+def list_file_characters(save_directory="data/save_games"):
+    """
+    Get names of all <name>_save.txt / <name>_save.bin files in a directory
     """
     if not os.path.exists(save_directory):
         return []
@@ -169,7 +609,7 @@ def list_saved_characters(save_directory="data/save_games"):
     saved_chars = []
     try:
         for filename in os.listdir(save_directory):
-            if filename.endswith("_save.txt"):
+            if filename.endswith("_save.txt") or filename.endswith("_save.bin"):
                 char_name = filename[:-9]
                 saved_chars.append(char_name)
     except OSError:
@@ -177,22 +617,982 @@ def list_saved_characters(save_directory="data/save_games"):
         
     return saved_chars
 
-def delete_character(character_name, save_directory="data/save_games"):
+def delete_file_character(character_name, save_directory="data/save_games"):
     """
     Delete a character's save file
     """
-    filename = f"{character_name}_save.txt"
-    filepath = os.path.join(save_directory, filename)
+    filepath = find_save_file(character_name, save_directory)
     
-    if not os.path.exists(filepath):
+    if filepath is None:
         raise CharacterNotFoundError(f"Cannot delete: Character {character_name} does not exist.")
         
     try:
         os.remove(filepath)
+        remove_character_log(character_name, save_directory)
         return True
     except OSError as e:
         raise IOError(f"Error deleting file: {e}")
 
+# ============================================================================
+# BULK OPERATIONS
+# ============================================================================
+
+BULK_WORKERS = 8
+
+def load_characters(character_names, save_directory="data/save_games", workers=BULK_WORKERS):
+    """
+    Load many characters using a thread pool
+    Returns the characters in the same order as character_names.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda name: load_character(name, save_directory), character_names))
+
+def save_characters(characters, save_directory="data/save_games", workers=BULK_WORKERS):
+    """
+    Save many characters using a thread pool
+    Stores that support save_many (SQLite) write them in one transaction;
+    save files are made durable together with one group commit.
+    """
+    characters = list(characters)
+    store = get_save_store(save_directory)
+    if store is not None and hasattr(store, "save_many"):
+        store.save_many(characters)
+        for character in characters:
+            mark_character_clean(character, save_directory)
+        return True
+
+    def save_in_batch(batch, character):
+        with use_commit_batch(batch):
+            save_character(character, save_directory)
+
+    with group_commit() as batch:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(lambda character: save_in_batch(batch, character), characters))
+    return True
+
+def transform_all_characters(transform, save_directory="data/save_games",
+                             workers=BULK_WORKERS, progress=None):
+    """
+    Load every saved character, call transform(character) on it and save it
+    back if it changed. Characters are processed in parallel.
+    progress(done, total) is called after each character.
+    Returns (changed_count, errors) where errors is a list of (name, message).
+    """
+    names = list_saved_characters(save_directory)
+    changed = 0
+    errors = []
+
+    def process(name):
+        character = load_character(name, save_directory)
+        transform(character)
+        return save_character_if_dirty(character, save_directory)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(process, name): name for name in names}
+        for done, future in enumerate(as_completed(futures), 1):
+            try:
+                if future.result():
+                    changed += 1
+            except Exception as e:
+                errors.append((futures[future], str(e)))
+            if progress:
+                progress(done, len(names))
+
+    return changed, errors
+
+# ============================================================================
+# SAVE VERIFICATION
+# ============================================================================
+
+def verify_saves(save_directory="data/save_games", workers=BULK_WORKERS, full=False, progress=None):
+    """
+    Check every save file in a directory for damage
+    Files are checked in chunks of VERIFY_CHUNK_SIZE across a process pool.
+    Saves with a valid checksum are not parsed unless full is True; older
+    saves without one are parsed and validated instead.
+    progress(done, total) is called after each chunk.
+    Returns (checked_count, problems) where problems is a list of
+    (filename, problem, message) and problem is "corrupt", "truncated",
+    "invalid" or "unreadable".
+    """
+    if not os.path.isdir(save_directory):
+        return 0, []
+
+    filenames = sorted(entry.name for entry in os.scandir(save_directory)
+                       if entry.name.endswith(("_save.txt", "_save.bin")))
+    chunks = [filenames[i:i + VERIFY_CHUNK_SIZE] for i in range(0, len(filenames), VERIFY_CHUNK_SIZE)]
+
+    if workers == 1 or len(chunks) <= 1:
+        results = (verify_save_files(save_directory, chunk, full) for chunk in chunks)
+        return collect_verify_results(chunks, results, len(filenames), progress)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(verify_save_files, [save_directory] * len(chunks), chunks, [full] * len(chunks))
+        return collect_verify_results(chunks, results, len(filenames), progress)
+
+def collect_verify_results(chunks, results, total, progress):
+    problems = []
+    done = 0
+    for chunk, chunk_problems in zip(chunks, results):
+        problems.extend(chunk_problems)
+        done += len(chunk)
+        if progress:
+            progress(done, total)
+    return total, problems
+
+def verify_save_files(save_directory, filenames, full=False):
+    """Check a list of save files (runs inside a worker process)"""
+    problems = []
+    for filename in filenames:
+        try:
+            with open(os.path.join(save_directory, filename), 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            problems.append((filename, "unreadable", str(e)))
+            continue
+
+        status = check_save_checksum(data)
+        if status == "corrupt":
+            problems.append((filename, status, "checksum does not match"))
+        elif status == "truncated":
+            problems.append((filename, status, "file ends before its checksum"))
+        elif status == "missing" or full:
+            try:
+                if data.startswith(BINARY_SAVE_MAGIC):
+                    character, log_id = decode_binary_save(data)
+                else:
+                    character, log_id = decode_text_save(data.decode("utf-8"))
+                validate_character_data(character)
+            except (ValueError, IndexError, struct.error) as e:
+                problems.append((filename, "invalid", f"malformed data: {e}"))
+            except InvalidSaveDataError as e:
+                problems.append((filename, "invalid", str(e)))
+    return problems
+
+# ============================================================================
+# ATOMIC WRITES AND GROUP COMMIT
+# ============================================================================
+
+# Inside group_commit() the batch is stored here for the current thread
+commit_context = threading.local()
+
+# Makes every temp file name unique, even for repeated saves of one file
+temp_file_counter = itertools.count()
+
+class CommitBatch:
+    """
+    Saves waiting to be made durable together
+    Atomic writes inside a batch leave their temp files unsynced. commit()
+    fsyncs all of them, renames them into place and fsyncs each directory
+    once, so many saves share one round of fsyncs. Only then are the
+    after-commit callbacks run (they delete stale files).
+    renames maps each target path to its newest temp file, so a file saved
+    twice in one batch is only renamed once.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.renames = {}
+        self.sync_paths = set()
+        self.after_commit = []
+
+    def commit(self):
+        """
+        Make the batch durable
+        A failing entry does not stop the others; its temp file is removed,
+        its callbacks are skipped and the first error is raised at the end.
+        """
+        with self.lock:
+            renames, self.renames = self.renames, {}
+            sync_paths, self.sync_paths = self.sync_paths, set()
+            after_commit, self.after_commit = self.after_commit, []
+
+        errors = []
+        failed = set()
+        for filepath, temp_path in renames.items():
+            try:
+                fsync_path(temp_path)
+            except OSError as e:
+                errors.append(e)
+                failed.add(filepath)
+                remove_file_if_exists(temp_path)
+        for path in sync_paths:
+            try:
+                fsync_path(path)
+            except FileNotFoundError:
+                pass  # Log removed by a compaction later in the batch
+            except OSError as e:
+                errors.append(e)
+
+        directories = set(os.path.dirname(filepath) for filepath in renames)
+        with manifest_lock:
+            # Keep an up-to-date manifest fresh across our own renames
+            fresh = [d for d in directories if is_manifest_fresh(d)]
+            for filepath, temp_path in renames.items():
+                if filepath in failed:
+                    continue
+                try:
+                    os.replace(temp_path, filepath)
+                except OSError as e:
+                    errors.append(e)
+                    failed.add(filepath)
+                    remove_file_if_exists(temp_path)
+            for directory in fresh:
+                if not manifest_updates.get(os.path.normpath(directory), [0])[0]:
+                    stamp_manifest(directory)
+
+        for directory in directories:
+            fsync_directory(directory)
+        for filepath, callback in after_commit:
+            if filepath not in failed:
+                callback()
+
+        if errors:
+            raise errors[0]
+
+@contextmanager
+def group_commit():
+    """
+    Make every save in the with-block durable with one batch of fsyncs
+    Example:
+        with group_commit():
+            for character in characters:
+                save_character(character)
+    """
+    batch = getattr(commit_context, "batch", None)
+    if batch is not None:
+        yield batch  # Nested: join the outer batch
+        return
+
+    batch = CommitBatch()
+    commit_context.batch = batch
+    try:
+        yield batch
+    finally:
+        commit_context.batch = None
+        batch.commit()
+
+@contextmanager
+def use_commit_batch(batch):
+    """Join another thread's group_commit() batch from a worker thread"""
+    previous = getattr(commit_context, "batch", None)
+    commit_context.batch = batch
+    try:
+        yield batch
+    finally:
+        commit_context.batch = previous
+
+def write_file_atomic(filepath, data, mode='w', use_batch=True):
+    """
+    Write a file via a temp file and os.replace
+    Outside a batch the temp file and directory are fsynced right away;
+    inside group_commit() that work is left to the batch.
+    """
+    batch = getattr(commit_context, "batch", None) if use_batch else None
+    temp_path = f"{filepath}.{os.getpid()}.{next(temp_file_counter)}.tmp"
+    try:
+        with open(temp_path, mode) as f:
+            f.write(data)
+            if batch is None:
+                f.flush()
+                os.fsync(f.fileno())
+    except OSError:
+        remove_file_if_exists(temp_path)
+        raise
+
+    if batch is not None:
+        with batch.lock:
+            superseded = batch.renames.get(filepath)
+            batch.renames[filepath] = temp_path
+        if superseded is not None:
+            remove_file_if_exists(superseded)  # An older write in this batch
+        return
+
+    os.replace(temp_path, filepath)
+    fsync_directory(os.path.dirname(filepath))
+
+def sync_appended_file(f):
+    """fsync a file opened for append now, or at the end of the batch"""
+    f.flush()
+    batch = getattr(commit_context, "batch", None)
+    if batch is None:
+        os.fsync(f.fileno())
+    else:
+        with batch.lock:
+            batch.sync_paths.add(f.name)
+
+def run_after_commit(callback, use_batch=True, filepath=None):
+    """
+    Run callback once the current batch is durable (now if no batch)
+    With filepath, the callback is skipped if that file's rename failed.
+    """
+    batch = getattr(commit_context, "batch", None) if use_batch else None
+    if batch is None:
+        callback()
+    else:
+        with batch.lock:
+            batch.after_commit.append((filepath, callback))
+
+def fsync_path(path):
+    """fsync a file by path (opened for writing: Windows cannot flush a read-only handle)"""
+    fd = os.open(path, os.O_RDWR)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def fsync_directory(directory):
+    """fsync a directory so renames in it survive a crash (skipped where unsupported)"""
+    try:
+        fd = os.open(directory or ".", os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def remove_file_if_exists(path):
+    if os.path.exists(path):
+        os.remove(path)
+
+# ============================================================================
+# BACKGROUND SAVING
+# ============================================================================
+
+def copy_character(character):
+    """Copy a character so later changes to it cannot affect the copy"""
+    copied = {}
+    for key, value in character.items():
+        copied[key] = list(value) if isinstance(value, list) else value
+    return copied
+
+class SaveWriter:
+    """
+    Background thread that writes saves off the game loop
+    submit() takes a snapshot of the character and returns immediately.
+    If a character is submitted again before its save was written, only
+    the newest snapshot is written. The queue is bounded, so a stalled disk
+    eventually makes submit() wait instead of using unbounded memory.
+    flush() blocks until every submitted save is on disk.
+    With group_commit_window (seconds), saves arriving within the window
+    are written as one group_commit() batch.
+    """
+
+    def __init__(self, save_directory="data/save_games", max_pending=64, group_commit_window=None):
+        self.save_directory = save_directory
+        self.group_commit_window = group_commit_window
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.pending = {}
+        self.submitted = {}
+        self.errors = []
+        self.writes = 0
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.run, name="SaveWriter", daemon=True)
+        self.thread.start()
+
+    def submit(self, character):
+        """
+        Queue a save of the character's current state
+        Returns False if the same state was already submitted.
+        """
+        name = character['name']
+        state = get_character_snapshot(character)
+        with self.lock:
+            if self.submitted.get(name) == state:
+                return False
+            self.submitted[name] = state
+            already_queued = name in self.pending
+            self.pending[name] = copy_character(character)
+        if not already_queued:
+            self.queue.put(name)
+        return True
+
+    def run(self):
+        running = True
+        while running:
+            names = [self.queue.get()]
+            if self.group_commit_window:
+                deadline = time.monotonic() + self.group_commit_window
+                while names[-1] is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        names.append(self.queue.get(timeout=remaining))
+                    except queue.Empty:
+                        break
+
+            batch = group_commit() if self.group_commit_window else nullcontext()
+            try:
+                with batch:
+                    for name in names:
+                        if name is None:
+                            running = False
+                        else:
+                            self.write(name)
+            except Exception as e:
+                self.record_error(None, e)
+            finally:
+                for name in names:
+                    self.queue.task_done()
+
+    def write(self, name):
+        with self.lock:
+            snapshot = self.pending.pop(name, None)
+        if snapshot is None:
+            return
+        try:
+            save_character(snapshot, self.save_directory)
+            self.writes += 1
+        except Exception as e:
+            self.record_error(name, e)
+
+    def record_error(self, name, error):
+        with self.lock:
+            self.errors.append(error)
+            if name is None:
+                self.submitted.clear()  # A batch failed; allow every retry
+            else:
+                self.submitted.pop(name, None)
+
+    def flush(self):
+        """
+        Wait until every submitted save is written
+        Returns the errors raised by saves since the last flush.
+        """
+        self.queue.join()
+        with self.lock:
+            errors = self.errors
+            self.errors = []
+        return errors
+
+    def close(self):
+        """Flush and stop the writer thread"""
+        errors = self.flush()
+        self.queue.put(None)
+        self.thread.join()
+        return errors
+
+# ============================================================================
+# SAVE MANIFEST
+# ============================================================================
+
+def list_character_summaries(save_directory="data/save_games", sort_by="name", reverse=False):
+    """
+    Get {'name', 'class', 'level', 'gold'} for every saved character
+    File saves are listed from save_manifest.txt with a single read. The
+    manifest is stamped with the directory's mtime after every update; if a
+    save file was added or removed behind its back the times differ and the
+    manifest is rebuilt from the save files.
+    """
+    store = get_save_store(save_directory)
+    if store is not None:
+        if hasattr(store, "list_summaries"):
+            summaries = store.list_summaries()
+        else:
+            summaries = [get_character_summary(c) for c in load_characters(store.list_names(), save_directory)]
+    else:
+        summaries = read_manifest(save_directory)
+        if summaries is None:
+            summaries = rebuild_manifest(save_directory)
+    return sorted(summaries, key=lambda summary: summary[sort_by], reverse=reverse)
+
+def get_character_summary(character):
+    return {field: character[field] for field in SUMMARY_FIELDS}
+
+def encode_manifest_entry(summary):
+    """One manifest line: SET<tab>name<tab>class<tab>level<tab>gold"""
+    return "\t".join(["SET"] + [str(summary[field]) for field in SUMMARY_FIELDS])
+
+def get_manifest_path(save_directory):
+    return os.path.join(save_directory, MANIFEST_FILENAME)
+
+def is_manifest_fresh(save_directory):
+    """The manifest is fresh when its mtime matches the directory's"""
+    try:
+        manifest_mtime = os.stat(get_manifest_path(save_directory)).st_mtime_ns
+        directory_mtime = os.stat(save_directory).st_mtime_ns
+    except OSError:
+        return False
+    return manifest_mtime == directory_mtime
+
+def stamp_manifest(save_directory):
+    """Set the manifest's mtime to the directory's to mark it fresh"""
+    directory_mtime = os.stat(save_directory).st_mtime_ns
+    os.utime(get_manifest_path(save_directory), ns=(directory_mtime, directory_mtime))
+
+def read_manifest(save_directory):
+    """
+    Read manifest summaries, or None if the manifest is missing or stale
+    Later lines override earlier ones; the file is compacted here when it has
+    collected many more lines than characters.
+    """
+    with manifest_lock:
+        if manifest_updates.get(os.path.normpath(save_directory), [0])[0]:
+            return None  # Saves in flight; let the caller rebuild
+        if not is_manifest_fresh(save_directory):
+            return None
+        try:
+            with open(get_manifest_path(save_directory), 'r') as f:
+                lines = f.read().split("\n")[:-1]
+        except IOError:
+            return None
+
+        if not lines or lines[0] != MANIFEST_HEADER:
+            return None
+
+        summaries = {}
+        for line in lines[1:]:
+            parts = line.split("\t")
+            if parts[0] == "SET" and len(parts) == 1 + len(SUMMARY_FIELDS):
+                summary = dict(zip(SUMMARY_FIELDS, parts[1:]))
+                summary['level'] = int(summary['level'])
+                summary['gold'] = int(summary['gold'])
+                summaries[summary['name']] = summary
+            elif parts[0] == "DEL" and len(parts) == 2:
+                summaries.pop(parts[1], None)
+            else:
+                return None  # Unreadable line: treat as drift
+
+        summaries = list(summaries.values())
+        if len(lines) > 2 * len(summaries) + 50:
+            write_manifest_file(save_directory, summaries)
+        return summaries
+
+def write_manifest(save_directory, summaries):
+    """Atomically replace the manifest and mark it fresh"""
+    with manifest_lock:
+        write_manifest_file(save_directory, summaries)
+
+def write_manifest_file(save_directory, summaries):
+    """
+    Write the manifest with a temp file + os.replace (manifest_lock must be
+    held). It is only stamped fresh when no save is in flight, otherwise the
+    next listing rebuilds it.
+    """
+    manifest_path = get_manifest_path(save_directory)
+    temp_path = manifest_path + ".tmp"
+    with open(temp_path, 'w') as f:
+        f.write(MANIFEST_HEADER + "\n")
+        for summary in summaries:
+            f.write(encode_manifest_entry(summary) + "\n")
+    os.replace(temp_path, manifest_path)
+    if not manifest_updates.get(os.path.normpath(save_directory), [0])[0]:
+        stamp_manifest(save_directory)
+
+def rebuild_manifest(save_directory="data/save_games"):
+    """Rebuild the manifest by loading every save file (slow path)"""
+    if not os.path.exists(save_directory):
+        return []
+
+    summaries = []
+    for name in list_file_characters(save_directory):
+        try:
+            summaries.append(get_character_summary(load_file_character(name, save_directory)))
+        except (InvalidSaveDataError, SaveFileCorruptedError, CharacterNotFoundError):
+            continue  # Unreadable saves are left out of the menu
+    write_manifest(save_directory, summaries)
+    return summaries
+
+def begin_manifest_update(save_directory):
+    """
+    Call before a save file is written or deleted
+    Returns whether the manifest can be trusted. Freshness is only checked
+    when no other save is in flight in this process, since our own writes
+    change the directory's mtime until finish_manifest_update stamps it.
+    """
+    key = os.path.normpath(save_directory)
+    with manifest_lock:
+        state = manifest_updates.get(key)
+        if state is None:
+            state = manifest_updates[key] = [0, False]
+        if state[0] == 0:
+            state[1] = is_manifest_fresh(save_directory)
+        state[0] += 1
+        return state[1]
+
+def finish_manifest_update(save_directory, trusted, record):
+    """
+    Call after a save file was written or deleted
+    Appends record (one manifest line; a single small append) if the manifest
+    was trusted, and stamps it once the last in-flight save finishes.
+    """
+    key = os.path.normpath(save_directory)
+    with manifest_lock:
+        state = manifest_updates[key]
+        state[0] -= 1
+        if not trusted:
+            return
+        try:
+            if record is not None:
+                with open(get_manifest_path(save_directory), 'a') as f:
+                    f.write(record + "\n")
+            if state[0] == 0:
+                stamp_manifest(save_directory)
+        except OSError:
+            state[1] = False  # Leave it stale; the next listing rebuilds it
+
+# ============================================================================
+# SAVE SETTINGS
+# ============================================================================
+
+def configure_save_directory(save_directory="data/save_games", **settings):
+    """
+    Store settings for a save directory in its save_config.txt
+    Example: configure_save_directory("data/save_games", mode="log")
+    """
+    current = dict(get_save_settings(save_directory))
+    current.update(settings)
+
+    os.makedirs(save_directory, exist_ok=True)
+    config_path = os.path.join(save_directory, SAVE_CONFIG_FILENAME)
+    with open(config_path, 'w') as f:
+        for key, value in current.items():
+            f.write(f"{key.upper()}: {value}\n")
+    save_settings_cache.pop(os.path.normpath(save_directory), None)
+    return current
+
+def get_save_settings(save_directory="data/save_games"):
+    """Read a save directory's settings, falling back to DEFAULT_SAVE_SETTINGS"""
+    config_path = os.path.join(save_directory, SAVE_CONFIG_FILENAME)
+    try:
+        mtime = os.stat(config_path).st_mtime_ns
+    except OSError:
+        return DEFAULT_SAVE_SETTINGS
+
+    cache_key = os.path.normpath(save_directory)
+    cached = save_settings_cache.get(cache_key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    settings = dict(DEFAULT_SAVE_SETTINGS)
+    with open(config_path, 'r') as f:
+        for line in f:
+            if ":" in line:
+                key, value = line.split(":", 1)
+                settings[key.strip().lower()] = value.strip()
+    save_settings_cache[cache_key] = (mtime, settings)
+    return settings
+
+def get_save_store(save_directory="data/save_games"):
+    """
+    Get the store object for a directory's save backend
+    Returns None for the built-in text backend. Store objects are created
+    once per directory and reused, so connections stay open.
+    """
+    backend = get_save_settings(save_directory)["backend"]
+    if backend == "text":
+        return None
+    if backend not in SAVE_BACKENDS:
+        raise ValueError(f"Unknown save backend '{backend}'. Choose from: {['text'] + list(SAVE_BACKENDS)}")
+
+    cache_key = (os.path.normpath(save_directory), backend)
+    store = save_stores.get(cache_key)
+    if store is None:
+        with save_stores_lock:
+            store = save_stores.get(cache_key)
+            if store is None:
+                os.makedirs(save_directory, exist_ok=True)
+                store = SAVE_BACKENDS[backend](save_directory)
+                save_stores[cache_key] = store
+    return store
+
+def close_save_stores():
+    """Close every open save store"""
+    for store in save_stores.values():
+        store.close()
+    save_stores.clear()
+
+# ============================================================================
+# SQLITE SAVE BACKEND
+# ============================================================================
+
+class SQLiteSaveStore:
+    """
+    Save backend keeping every character of a directory in one saves.db
+    Uses WAL mode, a primary key index on name, one shared connection and
+    fixed parameterised statements (which sqlite3 prepares once and caches).
+    Lists are stored comma-separated, the same as the text format.
+    """
+
+    DATABASE_FILENAME = "saves.db"
+
+    CREATE_SQL = """
+        CREATE TABLE IF NOT EXISTS characters (
+            name TEXT PRIMARY KEY,
+            class TEXT NOT NULL,
+            level INTEGER NOT NULL,
+            health INTEGER NOT NULL,
+            max_health INTEGER NOT NULL,
+            strength INTEGER NOT NULL,
+            magic INTEGER NOT NULL,
+            experience INTEGER NOT NULL,
+            gold INTEGER NOT NULL,
+            inventory TEXT NOT NULL,
+            active_quests TEXT NOT NULL,
+            completed_quests TEXT NOT NULL
+        )"""
+    SAVE_SQL = "INSERT OR REPLACE INTO characters VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    LOAD_SQL = "SELECT * FROM characters WHERE name = ?"
+    LIST_SQL = "SELECT name FROM characters ORDER BY name"
+    SUMMARY_SQL = "SELECT name, class, level, gold FROM characters"
+    DELETE_SQL = "DELETE FROM characters WHERE name = ?"
+
+    def __init__(self, save_directory):
+        self.path = os.path.join(save_directory, self.DATABASE_FILENAME)
+        self.lock = threading.Lock()
+        try:
+            self.connection = sqlite3.connect(self.path, check_same_thread=False)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.execute(self.CREATE_SQL)
+            self.connection.commit()
+        except sqlite3.Error as e:
+            raise IOError(f"Could not open save database {self.path}: {e}")
+
+    def to_row(self, character):
+        row = []
+        for field in SAVE_FIELDS:
+            value = character[field]
+            if isinstance(value, list):
+                value = ",".join(value)
+            row.append(value)
+        return row
+
+    def save(self, character):
+        self.save_many([character])
+
+    def save_many(self, characters):
+        """Save several characters in one transaction"""
+        rows = [self.to_row(character) for character in characters]
+        try:
+            with self.lock, self.connection:
+                self.connection.executemany(self.SAVE_SQL, rows)
+        except sqlite3.Error as e:
+            raise IOError(f"Error saving character: {e}")
+
+    def load(self, character_name):
+        try:
+            with self.lock:
+                row = self.connection.execute(self.LOAD_SQL, (character_name,)).fetchone()
+        except sqlite3.Error:
+            raise SaveFileCorruptedError(f"Could not read {character_name} from {self.path}.")
+        if row is None:
+            raise CharacterNotFoundError(f"No save file found for {character_name}")
+
+        character = dict(zip(SAVE_FIELDS, row))
+        for field in ["inventory", "active_quests", "completed_quests"]:
+            character[field] = character[field].split(",") if character[field] else []
+        validate_character_data(character)
+        return Character(character)
+
+    def list_names(self):
+        try:
+            with self.lock:
+                return [row[0] for row in self.connection.execute(self.LIST_SQL)]
+        except sqlite3.Error:
+            return []
+
+    def list_summaries(self):
+        try:
+            with self.lock:
+                rows = self.connection.execute(self.SUMMARY_SQL).fetchall()
+        except sqlite3.Error:
+            return []
+        return [dict(zip(SUMMARY_FIELDS, row)) for row in rows]
+
+    def delete(self, character_name):
+        try:
+            with self.lock, self.connection:
+                cursor = self.connection.execute(self.DELETE_SQL, (character_name,))
+        except sqlite3.Error as e:
+            raise IOError(f"Error deleting character: {e}")
+        if cursor.rowcount == 0:
+            raise CharacterNotFoundError(f"Cannot delete: Character {character_name} does not exist.")
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+# Save backends other than the built-in text files, selected with
+# configure_save_directory(save_directory, backend=<name>)
+SAVE_BACKENDS = {"sqlite": SQLiteSaveStore}
+save_stores = {}
+save_stores_lock = threading.Lock()
+
+def migrate_text_saves_to_sqlite(save_directory="data/save_games", remove_text_files=False):
+    """
+    Import every text or binary save in a directory into saves.db and switch the
+    directory to the sqlite backend. Returns the number of characters imported.
+    """
+    names = list_file_characters(save_directory)
+    characters = [load_file_character(name, save_directory) for name in names]
+
+    store = SQLiteSaveStore(save_directory)
+    try:
+        store.save_many(characters)
+    finally:
+        store.close()
+
+    configure_save_directory(save_directory, backend="sqlite")
+
+    if remove_text_files:
+        for name in names:
+            delete_file_character(name, save_directory)
+    return len(characters)
+
+# ============================================================================
+# CHANGE LOG (event-sourced saves)
+# ============================================================================
+
+def save_character_changes(character, save_directory="data/save_games"):
+    """
+    Append the changes since the last save to <name>_save.log
+    Falls back to compacting (writing a fresh snapshot) when there is no
+    known on-disk state yet or the log has grown past LOG_COMPACT_THRESHOLD.
+    """
+    key = get_snapshot_key(character['name'], save_directory)
+    baseline = saved_snapshots.get(key)
+    state = log_states.get(key)
+    if baseline is None or state is None or find_save_file(character['name'], save_directory) is None:
+        compact_character_log(character, save_directory)
+        return
+
+    records = get_change_records(baseline, get_character_snapshot(character))
+    if not records:
+        return
+    if state['records'] + len(records) > LOG_COMPACT_THRESHOLD:
+        compact_character_log(character, save_directory)
+        return
+
+    log_path = os.path.join(save_directory, f"{character['name']}_save.log")
+    try:
+        with open(log_path, 'ab') as f:
+            if f.tell() == 0:
+                f.write(f"LOG_ID: {state['log_id']}\n".encode("utf-8"))
+            f.write(("\n".join(records) + "\n").encode("utf-8"))
+            sync_appended_file(f)
+    except IOError as e:
+        raise IOError(f"Error saving character: {e}")
+    state['records'] += len(records)
+
+def compact_character_log(character, save_directory="data/save_games"):
+    """
+    Fold the change log into a fresh snapshot
+    The snapshot gets a new LOG_ID before the old log is removed, so a crash
+    in between never replays the old log on top of the new snapshot.
+    """
+    key = get_snapshot_key(character['name'], save_directory)
+    state = log_states.get(key)
+    log_id = state['log_id'] + 1 if state else 1
+
+    # Compaction is rare, so it is always written straight away (not batched)
+    # so that removing the old log can never overtake the new snapshot
+    write_character_snapshot(character, save_directory, log_id, use_batch=False)
+    remove_character_log(character['name'], save_directory)
+    log_states[key] = {'log_id': log_id, 'records': 0}
+
+def remove_character_log(character_name, save_directory="data/save_games"):
+    """Delete a character's change log if there is one"""
+    log_path = os.path.join(save_directory, f"{character_name}_save.log")
+    if os.path.exists(log_path):
+        os.remove(log_path)
+    log_states.pop(get_snapshot_key(character_name, save_directory), None)
+
+def get_change_records(old_snapshot, new_snapshot):
+    """
+    Describe the difference between two snapshots as log records
+    Numbers: "ADD GOLD -25"   Text: "SET CLASS Mage"
+    Lists:   "APPEND INVENTORY iron_sword" / "REMOVE ACTIVE_QUESTS first_steps"
+    """
+    records = []
+    for field in SAVE_FIELDS:
+        before = old_snapshot[field]
+        after = new_snapshot[field]
+        if before == after:
+            continue
+        if isinstance(after, tuple):
+            for value in (Counter(before) - Counter(after)).elements():
+                records.append(f"REMOVE {field.upper()} {value}")
+            for value in (Counter(after) - Counter(before)).elements():
+                records.append(f"APPEND {field.upper()} {value}")
+        elif isinstance(before, int) and isinstance(after, int):
+            records.append(f"ADD {field.upper()} {after - before}")
+        else:
+            records.append(f"SET {field.upper()} {after}")
+    return records
+
+def replay_character_log(character, log_path, log_id):
+    """
+    Apply a change log to a character loaded from its snapshot
+    Returns the number of records applied. A log whose LOG_ID does not match
+    the snapshot is left over from before a compaction and is ignored, and a
+    final record without a newline (torn write) is dropped.
+    """
+    if not os.path.exists(log_path):
+        return 0
+    with open(log_path, 'rb') as f:
+        content = f.read()
+    end = content.rfind(b"\n") + 1
+
+    if end < len(content):
+        # Cut the torn record off so later appends start on a clean line
+        with open(log_path, 'r+b') as f:
+            f.truncate(end)
+
+    # Logs written in text mode on Windows end their lines with \r\n
+    lines = [line.rstrip("\r") for line in content[:end].decode("utf-8").split("\n")[:-1]]
+
+    if not lines or lines[0] != f"LOG_ID: {log_id}":
+        return 0
+
+    for line in lines[1:]:
+        operation, field, value = line.split(" ", 2)
+        field = field.lower()
+        if field not in SAVE_FIELDS:
+            raise ValueError(f"Unknown field in change log: {field}")
+        if operation == "ADD":
+            character[field] += int(value)
+        elif operation == "SET":
+            character[field] = value
+        elif operation == "APPEND":
+            character[field].append(value)
+        elif operation == "REMOVE":
+            character[field].remove(value)
+        else:
+            raise ValueError(f"Unknown change log operation: {operation}")
+    return len(lines) - 1
+
+# ============================================================================
+# CHANGE TRACKING
+# ============================================================================
+
+def get_character_snapshot(character):
+    """Get an immutable copy of the saved fields (lists become tuples)"""
+    snapshot = {}
+    for field in SAVE_FIELDS:
+        value = character[field]
+        if isinstance(value, list):
+            value = tuple(value)
+        snapshot[field] = value
+    return snapshot
+
+def get_snapshot_key(character_name, save_directory):
+    return os.path.join(os.path.normpath(save_directory), character_name)
+
+def mark_character_clean(character, save_directory="data/save_games"):
+    """Record the character's current state as what is on disk"""
+    key = get_snapshot_key(character['name'], save_directory)
+    saved_snapshots[key] = get_character_snapshot(character)
+
+def is_character_dirty(character, save_directory="data/save_games"):
+    """Check if the character changed since it was last saved or loaded"""
+    key = get_snapshot_key(character['name'], save_directory)
+    return saved_snapshots.get(key) != get_character_snapshot(character)
+
 # ============================================================================
 # CHARACTER OPERATIONS
 # ============================================================================
@@ -205,19 +1605,58 @@ def gain_experience(character, xp_amount):
         raise CharacterDeadError("Cannot gain experience while dead.")
 
     character['experience'] += xp_amount
-    
-    while True:
-        xp_needed = character['level'] * 100
-        if character['experience'] >= xp_needed:
-            character['experience'] -= xp_needed
-            character['level'] += 1
-            character['max_health'] += 10
-            character['strength'] += 2
-            character['magic'] += 2
-            character['health'] = character['max_health']
-            print(f"*** LEVEL UP! {character['name']} is now level {character['level']}! ***")
-        else:
-            break
+    apply_level_ups(character)
+
+def apply_level_ups(character):
+    """
+    Level the character up as far as its experience allows, in one step
+    Stat growth for every level gained is applied at once and each
+    level-up listener is called once. Returns the number of levels gained.
+    """
+    old_level = character['level']
+    new_level, experience = resolve_level(old_level, character['experience'])
+    if new_level == old_level:
+        return 0
+
+    gained = new_level - old_level
+    character['level'] = new_level
+    character['experience'] = experience
+    character['max_health'] += 10 * gained
+    character['strength'] += 2 * gained
+    character['magic'] += 2 * gained
+    character['health'] = character['max_health']
+
+    for listener in level_up_listeners:
+        listener(character, old_level, new_level)
+    return gained
+
+def resolve_level(level, experience):
+    """
+    Get (new_level, leftover_experience) for a character at level with
+    experience towards the next level
+    """
+    if experience < level * XP_PER_LEVEL:
+        return level, experience
+
+    total = get_total_experience(level) + experience
+    if total < LEVEL_XP_TABLE[-1]:
+        new_level = bisect_right(LEVEL_XP_TABLE, total)
+    else:
+        # level * (level - 1) <= total / 50, solved for level
+        new_level = (1 + isqrt(1 + 4 * (total // (XP_PER_LEVEL // 2)))) // 2
+    return new_level, total - get_total_experience(new_level)
+
+def get_total_experience(level):
+    """Total experience needed to reach level from level 1"""
+    return XP_PER_LEVEL * level * (level - 1) // 2
+
+def add_level_up_listener(listener):
+    """Call listener(character, old_level, new_level) after every level up"""
+    level_up_listeners.append(listener)
+
+def remove_level_up_listener(listener):
+    if listener in level_up_listeners:
+        level_up_listeners.remove(listener)
 
 def add_gold(character, amount):
     """
@@ -258,6 +1697,113 @@ def revive_character(character):
     character['health'] = int(character['max_health'] * 0.5)
     return True
 
+# ============================================================================
+# CHARACTER TABLES
+# ============================================================================
+
+# Stats a CharacterTable stores as parallel integer arrays
+TABLE_STAT_FIELDS = ["level", "health", "max_health", "strength", "magic", "experience", "gold"]
+
+class CharacterTable:
+    """
+    Many characters stored column by column for population-wide updates
+    Each stat in TABLE_STAT_FIELDS is one array('q') with a row per
+    character; names, classes and the ID lists stay in plain lists. The
+    methods below apply the same rules as gain_experience, add_gold,
+    heal_character and revive_character to every row in one pass, without
+    building a dict per character.
+    """
+
+    def __init__(self, characters=()):
+        characters = list(characters)
+        self.names = [character['name'] for character in characters]
+        self.classes = [character['class'] for character in characters]
+        for field in TABLE_STAT_FIELDS:
+            setattr(self, field, array('q', [character[field] for character in characters]))
+        for field in ["inventory", "active_quests", "completed_quests"]:
+            setattr(self, field, [list(character[field]) for character in characters])
+
+    def __len__(self):
+        return len(self.names)
+
+    def get_character(self, row):
+        """Build the Character stored in one row"""
+        character = Character()
+        for field in SAVE_FIELDS:
+            column = getattr(self, "names" if field == "name" else "classes" if field == "class" else field)
+            value = column[row]
+            character[field] = list(value) if isinstance(value, list) else value
+        return character
+
+    def to_characters(self):
+        """Build a Character for every row"""
+        return [self.get_character(row) for row in range(len(self))]
+
+    def gain_experience(self, xp_amounts):
+        """
+        Add xp_amounts[row] experience to each living character and apply
+        level ups. Dead characters gain nothing. Level-up listeners are not
+        called.
+        Returns an array of levels gained per row.
+        """
+        self.check_row_count(xp_amounts, "experience amount")
+        self.experience = array('q', [xp + amount if health > 0 else xp for xp, amount, health
+                                      in zip(self.experience, xp_amounts, self.health)])
+        levels_gained = array('q', bytes(8 * len(self)))
+
+        # Only rows with enough experience for the next level need updating
+        for row in [row for row, (xp, level) in enumerate(zip(self.experience, self.level))
+                    if xp >= level * XP_PER_LEVEL]:
+            start_level = self.level[row]
+            level, self.experience[row] = resolve_level(start_level, self.experience[row])
+            gained = level - start_level
+            self.level[row] = level
+            self.max_health[row] += 10 * gained
+            self.strength[row] += 2 * gained
+            self.magic[row] += 2 * gained
+            self.health[row] = self.max_health[row]
+            levels_gained[row] = gained
+        return levels_gained
+
+    def add_gold(self, amounts):
+        """
+        Add amounts[row] gold to each character
+        Raises ValueError (and changes nothing) if any row would go negative.
+        """
+        self.check_row_count(amounts, "gold amount")
+        gold = array('q', [current + amount for current, amount in zip(self.gold, amounts)])
+        if gold and min(gold) < 0:
+            raise ValueError("Insufficient gold.")
+        self.gold = gold
+
+    def heal(self, mask, amount):
+        """
+        Heal every living character whose mask entry is true (mask None =
+        everyone) by up to amount. Returns an array of health restored.
+        """
+        if mask is None:
+            mask = [True] * len(self)
+        self.check_row_count(mask, "mask entry")
+        healed = array('q', [min(amount, max_health - health) if selected and health > 0 else 0
+                             for selected, health, max_health in zip(mask, self.health, self.max_health)])
+        self.health = array('q', [health + heal for health, heal in zip(self.health, healed)])
+        return healed
+
+    def check_row_count(self, values, label):
+        """Raise ValueError unless values has exactly one entry per row"""
+        if len(values) != len(self):
+            raise ValueError(f"Need one {label} per character, got {len(values)} for {len(self)}.")
+
+    def revive_dead(self):
+        """Revive every dead character with 50% health. Returns the number revived."""
+        revived = 0
+        health = self.health
+        for row, (current, max_health) in enumerate(zip(health, self.max_health)):
+            if current <= 0:
+                health[row] = int(max_health * 0.5)
+                revived += 1
+        return revived
+
 # ============================================================================
 # VALIDATION
 # ============================================================================
@@ -266,13 +1812,7 @@ def validate_character_data(character):
     """
     Validate that character dictionary has all required fields
     """
-    required_fields = [
-        "name", "class", "level", "health", "max_health", 
-        "strength", "magic", "experience", "gold", "inventory", 
-        "active_quests", "completed_quests"
-    ]
-    
-    for field in required_fields:
+    for field in SAVE_FIELDS:
         if field not in character:
             raise InvalidSaveDataError(f"Missing required field: {field}")
             
@@ -284,25 +1824,75 @@ def validate_character_data(character):
     return True
 
 if __name__ == "__main__":
-    print("=== CHARACTER MANAGER TEST ===")
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Character save tools")
+    subparsers = parser.add_subparsers(dest="command")
+
+    migrate_parser = subparsers.add_parser("migrate-sqlite", help="Import text saves into an SQLite save store")
+    migrate_parser.add_argument("save_directory", nargs="?", default="data/save_games")
+    migrate_parser.add_argument("--remove-text-files", action="store_true")
+
+    gold_parser = subparsers.add_parser("grant-gold", help="Give every saved character some gold")
+    gold_parser.add_argument("amount", type=int)
+
+    subparsers.add_parser("recompute-levels", help="Apply any level ups owed by each character's experience")
+
+    verify_parser = subparsers.add_parser("verify", help="Check every save file for corruption")
+    verify_parser.add_argument("save_directory", nargs="?", default="data/save_games")
+    verify_parser.add_argument("--workers", type=int, default=BULK_WORKERS)
+    verify_parser.add_argument("--full", action="store_true", help="Also parse saves whose checksum is valid")
+
+    for bulk_parser in (gold_parser, subparsers.choices["recompute-levels"]):
+        bulk_parser.add_argument("--save-dir", default="data/save_games")
+        bulk_parser.add_argument("--workers", type=int, default=BULK_WORKERS)
+
+    args = parser.parse_args()
+
+    def show_progress(done, total):
+        sys.stderr.write(f"\rProcessed {done}/{total}")
+        if done == total:
+            sys.stderr.write("\n")
+
+    if args.command == "migrate-sqlite":
+        count = migrate_text_saves_to_sqlite(args.save_directory, args.remove_text_files)
+        print(f"Imported {count} character(s) into {os.path.join(args.save_directory, SQLiteSaveStore.DATABASE_FILENAME)}")
+    elif args.command in ("grant-gold", "recompute-levels"):
+        if args.command == "grant-gold":
+            transform = lambda character: add_gold(character, args.amount)
+        else:
+            transform = apply_level_ups
+        changed, errors = transform_all_characters(transform, args.save_dir, args.workers, show_progress)
+        for name, message in errors:
+            print(f"{name}: {message}")
+        print(f"Updated {changed} character(s), {len(errors)} error(s).")
+        sys.exit(1 if errors else 0)
+    elif args.command == "verify":
+        checked, problems = verify_saves(args.save_directory, args.workers, args.full, show_progress)
+        for filename, problem, message in problems:
+            print(f"{filename}: {problem} ({message})")
+        print(f"Checked {checked} save file(s), {len(problems)} problem(s).")
+        sys.exit(1 if problems else 0)
+    else:
+        print("=== CHARACTER MANAGER TEST ===")
     
-    try:
-        char = create_character("TestHero", "Warrior")
-        print(f"Created: {char['name']} the {char['class']}")
-        print(f"Stats: HP={char['health']}, STR={char['strength']}, MAG={char['magic']}")
-    except InvalidCharacterClassError as e:
-        print(f"Invalid class: {e}")
+        try:
+            char = create_character("TestHero", "Warrior")
+            print(f"Created: {char['name']} the {char['class']}")
+            print(f"Stats: HP={char['health']}, STR={char['strength']}, MAG={char['magic']}")
+        except InvalidCharacterClassError as e:
+            print(f"Invalid class: {e}")
     
-    try:
-        save_character(char)
-        print("Character saved successfully")
-    except Exception as e:
-        print(f"Save error: {e}")
+        try:
+            save_character(char)
+            print("Character saved successfully")
+        except Exception as e:
+            print(f"Save error: {e}")
     
-    try:
-        loaded = load_character("TestHero")
-        print(f"Loaded: {loaded['name']}")
-    except CharacterNotFoundError:
-        print("Character not found")
-    except SaveFileCorruptedError:
-        print("Save file corrupted")
+        try:
+            loaded = load_character("TestHero")
+            print(f"Loaded: {loaded['name']}")
+        except CharacterNotFoundError:
+            print("Character not found")
+        except SaveFileCorruptedError:
+            print("Save file corrupted")
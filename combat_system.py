@@ -10,6 +10,7 @@ Handles combat mechanics
 """
 
 import random
+from array import array
 from custom_exceptions import (
     InvalidTargetError,
     CombatNotActiveError,
@@ -21,21 +22,25 @@ from custom_exceptions import (
 # ENEMY DEFINITIONS
 # ============================================================================
 
+ENEMY_TEMPLATES = {
+    "goblin": {"name": "Goblin", "health": 50, "max_health": 50, "strength": 8, "magic": 2, "xp_reward": 25, "gold_reward": 10},
+    "orc": {"name": "Orc", "health": 80, "max_health": 80, "strength": 12, "magic": 5, "xp_reward": 50, "gold_reward": 25},
+    "dragon": {"name": "Dragon", "health": 200, "max_health": 200, "strength": 25, "magic": 15, "xp_reward": 200, "gold_reward": 100}
+}
+
 def create_enemy(enemy_type):
     """
     Create an enemy based on type
     """
-    enemies = {
-        "goblin": {"name": "Goblin", "health": 50, "max_health": 50, "strength": 8, "magic": 2, "xp_reward": 25, "gold_reward": 10},
-        "orc": {"name": "Orc", "health": 80, "max_health": 80, "strength": 12, "magic": 5, "xp_reward": 50, "gold_reward": 25},
-        "dragon": {"name": "Dragon", "health": 200, "max_health": 200, "strength": 25, "magic": 15, "xp_reward": 200, "gold_reward": 100}
-    }
-    
-    if enemy_type not in enemies:
+    if enemy_type not in ENEMY_TEMPLATES:
         raise InvalidTargetError(f"Enemy type '{enemy_type}' not recognized.")
         
     # Return a copy so we don't modify the template
-    return enemies[enemy_type].copy()
+    return ENEMY_TEMPLATES[enemy_type].copy()
+
+def get_enemy_types():
+    """Get every enemy type create_enemy accepts"""
+    return list(ENEMY_TEMPLATES.keys())
 
 def get_random_enemy_for_level(character_level):
     """
@@ -52,37 +57,64 @@ def get_random_enemy_for_level(character_level):
 # COMBAT SYSTEM
 # ============================================================================
 
+# Player actions. Interactive battles map the menu choices onto these;
+# headless battles get them from a policy (see BATTLE POLICIES below).
+ATTACK = "attack"
+ABILITY = "ability"
+RUN = "run"
+MENU_ACTIONS = {'1': ATTACK, '2': ABILITY, '3': RUN}
+
 class SimpleBattle:
     """
     Simple turn-based combat system
+    Without a policy the player picks each action from a menu and the
+    battle prints as it goes. With a policy the battle is headless: the
+    policy picks actions, messages only go to output (a callable taking one
+    string) if given, and rng (a random.Random) drives every random roll.
+    max_turns ends a battle that goes on too long as a draw.
     """
     
-    def __init__(self, character, enemy):
+    def __init__(self, character, enemy, policy=None, output=None, rng=None, max_turns=None):
         """Initialize battle with character and enemy"""
         self.character = character
         self.enemy = enemy
         self.combat_active = False
         self.turn_counter = 0
+        self.policy = policy
+        self.output = output
+        self.rng = rng or random
+        self.max_turns = max_turns
+        self.damage_dealt = 0
+        self.damage_taken = 0
+        self.healing = 0
     
     def start_battle(self):
         """
         Start the combat loop
+        Returns a result dict with the winner ('player', 'enemy', 'escaped'
+        or 'draw'), rewards, turn count and damage totals.
         """
         if self.character['health'] <= 0:
             raise CharacterDeadError("Character is dead and cannot fight!")
             
         self.combat_active = True
-        display_battle_log(f"Battle started between {self.character['name']} and {self.enemy['name']}!")
+        self.log(f"Battle started between {self.character['name']} and {self.enemy['name']}!")
         
         while self.combat_active:
+            if self.max_turns is not None and self.turn_counter >= self.max_turns:
+                self.combat_active = False
+                self.log("The battle ends in a draw.")
+                return self.make_result('draw')
+            
             self.turn_counter += 1
-            display_combat_stats(self.character, self.enemy)
+            if self.policy is None and self.output is None:
+                display_combat_stats(self.character, self.enemy)
             
             # Player Turn
             try:
                 self.player_turn()
             except CombatNotActiveError:
-                break # Battle ended (e.g., ran away)
+                return self.make_result('escaped')  # Ran away
             
             # Check if enemy died
             result = self.check_battle_end()
@@ -103,31 +135,39 @@ class SimpleBattle:
         """
         if not self.combat_active:
             raise CombatNotActiveError("Combat is not active.")
-            
-        print("\n1. Basic Attack")
-        print("2. Special Ability")
-        print("3. Try to Run")
         
-        choice = input("Choose action (1-3): ")
+        if self.policy is None:
+            print("\n1. Basic Attack")
+            print("2. Special Ability")
+            print("3. Try to Run")
+            action = MENU_ACTIONS.get(input("Choose action (1-3): "))
+        else:
+            action = self.policy.choose_action(self)
+        
+        enemy_health = self.enemy['health']
+        character_health = self.character['health']
         
-        if choice == '1':
+        if action == ATTACK:
             damage = self.calculate_damage(self.character, self.enemy)
             self.apply_damage(self.enemy, damage)
-            display_battle_log(f"You hit {self.enemy['name']} for {damage} damage!")
+            self.log(f"You hit {self.enemy['name']} for {damage} damage!")
             
-        elif choice == '2':
-            msg = use_special_ability(self.character, self.enemy)
-            display_battle_log(msg)
+        elif action == ABILITY:
+            msg = use_special_ability(self.character, self.enemy, self.rng)
+            self.log(msg)
             
-        elif choice == '3':
+        elif action == RUN:
             if self.attempt_escape():
-                display_battle_log("You escaped safely!")
+                self.log("You escaped safely!")
                 self.combat_active = False
                 raise CombatNotActiveError("Escaped") # Break loop
             else:
-                display_battle_log("Failed to escape!")
+                self.log("Failed to escape!")
         else:
-            display_battle_log("Invalid choice, you missed your turn!")
+            self.log("Invalid choice, you missed your turn!")
+        
+        self.damage_dealt += enemy_health - self.enemy['health']
+        self.healing += self.character['health'] - character_health
     
     def enemy_turn(self):
         """
@@ -136,9 +176,11 @@ class SimpleBattle:
         if not self.combat_active:
             raise CombatNotActiveError("Combat is not active.")
             
+        character_health = self.character['health']
         damage = self.calculate_damage(self.enemy, self.character)
         self.apply_damage(self.character, damage)
-        display_battle_log(f"{self.enemy['name']} attacks you for {damage} damage!")
+        self.damage_taken += character_health - self.character['health']
+        self.log(f"{self.enemy['name']} attacks you for {damage} damage!")
     
     def calculate_damage(self, attacker, defender):
         """
@@ -162,38 +204,50 @@ class SimpleBattle:
         """
         if self.enemy['health'] <= 0:
             self.combat_active = False
-            display_battle_log(f"Victory! {self.enemy['name']} was defeated.")
-            return {
-                'winner': 'player', 
-                'xp_gained': self.enemy['xp_reward'], 
-                'gold_gained': self.enemy['gold_reward']
-            }
+            self.log(f"Victory! {self.enemy['name']} was defeated.")
+            return self.make_result('player', self.enemy['xp_reward'], self.enemy['gold_reward'])
             
         if self.character['health'] <= 0:
             self.combat_active = False
-            display_battle_log("Defeat! You have fallen in battle.")
-            return {
-                'winner': 'enemy', 
-                'xp_gained': 0, 
-                'gold_gained': 0
-            }
+            self.log("Defeat! You have fallen in battle.")
+            return self.make_result('enemy')
             
         return None
     
+    def make_result(self, winner, xp_gained=0, gold_gained=0):
+        """Build the structured result of a finished battle"""
+        return {
+            'winner': winner,
+            'xp_gained': xp_gained,
+            'gold_gained': gold_gained,
+            'turns': self.turn_counter,
+            'damage_dealt': self.damage_dealt,
+            'damage_taken': self.damage_taken,
+            'healing': self.healing
+        }
+    
+    def log(self, message):
+        """Send a battle message to the output sink, or print it if interactive"""
+        if self.output is not None:
+            self.output(message)
+        elif self.policy is None:
+            display_battle_log(message)
+    
     def attempt_escape(self):
         """
         Try to escape from battle
         """
         # 50% chance
-        return random.choice([True, False])
+        return self.rng.choice([True, False])
 
 # ============================================================================
 # SPECIAL ABILITIES
 # ============================================================================
 
-def use_special_ability(character, enemy):
+def use_special_ability(character, enemy, rng=None):
     """
     Use character's class-specific special ability
+    rng (a random.Random) is used for any random roll.
     """
     c_class = character['class']
     
@@ -202,7 +256,7 @@ def use_special_ability(character, enemy):
     elif c_class == "Mage":
         return mage_fireball(character, enemy)
     elif c_class == "Rogue":
-        return rogue_critical_strike(character, enemy)
+        return rogue_critical_strike(character, enemy, rng)
     elif c_class == "Cleric":
         return cleric_heal(character)
     else:
@@ -222,10 +276,10 @@ def mage_fireball(character, enemy):
     if enemy['health'] < 0: enemy['health'] = 0
     return f"Fireball! Dealt {damage} magic damage to {enemy['name']}."
 
-def rogue_critical_strike(character, enemy):
+def rogue_critical_strike(character, enemy, rng=None):
     """Rogue special ability"""
     # 50% chance for triple damage, else normal damage
-    if random.random() < 0.5:
+    if (rng or random).random() < 0.5:
         damage = character['strength'] * 3
         msg = "CRITICAL STRIKE! "
     else:
@@ -244,6 +298,171 @@ def cleric_heal(character):
         character['health'] = character['max_health']
     return f"Heal! Restored health to {character['health']}."
 
+# ============================================================================
+# BATTLE POLICIES
+# ============================================================================
+
+# A policy picks the player's action in a headless battle:
+# policy.choose_action(battle) returns ATTACK, ABILITY or RUN.
+
+class AlwaysAttackPolicy:
+    """Basic attack every turn"""
+
+    def choose_action(self, battle):
+        return ATTACK
+
+class AbilityFirstPolicy:
+    """Use the class ability every turn, unless it would be wasted"""
+
+    def choose_action(self, battle):
+        character = battle.character
+        if character['class'] == "Cleric" and character['health'] >= character['max_health']:
+            return ATTACK
+        if character['class'] in ("Warrior", "Mage", "Rogue", "Cleric"):
+            return ABILITY
+        return ATTACK
+
+class ScriptedPolicy:
+    """
+    Play a fixed sequence of actions, then keep attacking
+    With loop=True the sequence repeats instead.
+    """
+
+    def __init__(self, actions, loop=False):
+        self.actions = list(actions)
+        self.loop = loop
+
+    def choose_action(self, battle):
+        index = battle.turn_counter - 1
+        if self.loop and self.actions:
+            return self.actions[index % len(self.actions)]
+        if index < len(self.actions):
+            return self.actions[index]
+        return ATTACK
+
+def simulate_battle(character, enemy, policy, rng=None, max_turns=100, output=None):
+    """
+    Run one headless battle on copies of character and enemy
+    Returns the battle result; the originals are not changed.
+    """
+    battle = SimpleBattle(dict(character), dict(enemy), policy, output, rng, max_turns)
+    return battle.start_battle()
+
+# ============================================================================
+# BATCH SIMULATION
+# ============================================================================
+
+# Winner codes in simulate_battles results
+PLAYER_WON = 1
+ENEMY_WON = -1
+DRAW = 0
+
+# What the player's ABILITY does, per class (anything else just attacks)
+ABILITY_DAMAGE_STRENGTH = 1   # Flat damage: Warrior (strength * 2)
+ABILITY_DAMAGE_MAGIC = 2      # Flat damage: Mage (magic * 2)
+ABILITY_CRITICAL = 3          # Rogue: strength * 3 or strength, 50/50
+ABILITY_HEAL = 4              # Cleric: heal 30, attack instead at full health
+CLASS_ABILITY_KINDS = {
+    "Warrior": ABILITY_DAMAGE_STRENGTH,
+    "Mage": ABILITY_DAMAGE_MAGIC,
+    "Rogue": ABILITY_CRITICAL,
+    "Cleric": ABILITY_HEAL
+}
+
+def simulate_battles(characters, enemies, action=ATTACK, rng=None, max_turns=100):
+    """
+    Run many headless battles in lockstep
+    characters[i] fights enemies[i]. Every step plays one turn of each
+    battle that is still going, using the same rules as SimpleBattle with
+    AlwaysAttackPolicy (action=ATTACK) or AbilityFirstPolicy
+    (action=ABILITY); finished battles drop out of the live list. Health
+    is kept in arrays and the inputs are not changed. Rogue critical rolls
+    come from rng in battle order each step, so a seed gives the same
+    results, but not the same rolls as running the battles one by one.
+    A character who starts dead loses in 0 turns.
+    Returns {'winner', 'turns', 'character_health', 'enemy_health'}, each
+    an array with one entry per battle (winner uses PLAYER_WON, ENEMY_WON
+    and DRAW).
+    """
+    if action not in (ATTACK, ABILITY):
+        raise ValueError(f"Batch battles support {ATTACK!r} or {ABILITY!r}, got {action!r}")
+    if len(characters) != len(enemies):
+        raise ValueError("Need one enemy per character.")
+    rng = rng or random
+    count = len(characters)
+
+    character_health = array('q', [c['health'] for c in characters])
+    max_health = array('q', [c['max_health'] for c in characters])
+    enemy_health = array('q', [max(0, e['health']) for e in enemies])
+
+    # Strength and magic do not change during a battle, so every damage
+    # amount can be worked out once per battle
+    attack_damage = array('q', [max(1, c['strength'] - e['strength'] // 4)
+                                for c, e in zip(characters, enemies)])
+    enemy_damage = array('q', [max(1, e['strength'] - c['strength'] // 4)
+                               for c, e in zip(characters, enemies)])
+    if action == ABILITY:
+        kinds = array('b', [CLASS_ABILITY_KINDS.get(c['class'], 0) for c in characters])
+    else:
+        kinds = array('b', bytes(count))
+    strength = array('q', [c['strength'] for c in characters])
+    ability_damage = array('q', [c['strength'] * 2 if kind == ABILITY_DAMAGE_STRENGTH else c['magic'] * 2
+                                 for c, kind in zip(characters, kinds)])
+
+    winner = array('b', [ENEMY_WON if hp <= 0 else DRAW for hp in character_health])
+    turns = array('q', bytes(8 * count))
+    live = [i for i in range(count) if character_health[i] > 0]
+
+    roll = rng.random
+    turn = 0
+    while live and turn < max_turns:
+        turn += 1
+        still_live = []
+        for i in live:
+            # Player turn
+            kind = kinds[i]
+            if kind == 0:
+                damage = attack_damage[i]
+            elif kind == ABILITY_HEAL:
+                if character_health[i] < max_health[i]:
+                    character_health[i] = min(max_health[i], character_health[i] + 30)
+                    damage = 0
+                else:
+                    damage = attack_damage[i]
+            elif kind == ABILITY_CRITICAL:
+                damage = strength[i] * 3 if roll() < 0.5 else strength[i]
+            else:
+                damage = ability_damage[i]
+
+            hp = enemy_health[i] - damage
+            if hp <= 0:
+                enemy_health[i] = 0
+                winner[i] = PLAYER_WON
+                turns[i] = turn
+                continue
+            enemy_health[i] = hp
+
+            # Enemy turn
+            hp = character_health[i] - enemy_damage[i]
+            if hp <= 0:
+                character_health[i] = 0
+                winner[i] = ENEMY_WON
+                turns[i] = turn
+                continue
+            character_health[i] = hp
+            still_live.append(i)
+        live = still_live
+
+    for i in live:
+        turns[i] = turn  # Draws
+
+    return {
+        'winner': winner,
+        'turns': turns,
+        'character_health': character_health,
+        'enemy_health': enemy_health
+    }
+
 # ============================================================================
 # COMBAT UTILITIES
 # ============================================================================
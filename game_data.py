@@ -16,103 +16,594 @@ This module handles loading and validating game data from text files.
 """
 
 import os
+import glob
+import mmap
+import pickle
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from custom_exceptions import (
     InvalidDataFormatError,
     MissingDataFileError,
     CorruptedDataError
 )
 
+# Compiled cache settings. Bump the version whenever the parsed layout changes
+# so old cache files are rebuilt instead of loaded.
+CACHE_DIRECTORY_NAME = ".cache"
+CACHE_FORMAT_VERSION = 2
+
+# Declarative data schemas: field -> int, str, or a tuple of allowed values.
+# They are compiled once by compile_schema() into fast per-block checkers.
+QUEST_SCHEMA = {
+    "quest_id": str,
+    "title": str,
+    "description": str,
+    "reward_xp": int,
+    "reward_gold": int,
+    "required_level": int,
+    "prerequisite": str
+}
+
+ITEM_SCHEMA = {
+    "item_id": str,
+    "name": str,
+    "type": ("consumable", "weapon", "armor"),
+    "effect": str,
+    "cost": int,
+    "description": str
+}
+
+# Character classes: starting stats for create_character. MAX_HEALTH is the
+# same as HEALTH at level 1.
+CLASS_SCHEMA = {
+    "class_id": str,
+    "health": int,
+    "strength": int,
+    "magic": int,
+    "gold": int
+}
+
+# Stats an item effect is allowed to modify ("health:20" -> ("health", 20))
+EFFECT_STATS = ("health", "max_health", "strength", "magic")
+
 # ============================================================================
 # DATA LOADING FUNCTIONS
 # ============================================================================
 
-def load_quests(filename="data/quests.txt"):
-    """Load quest data from file"""
-    if not os.path.exists(filename):
-        raise MissingDataFileError(f"Quest data file not found: {filename}")
+def load_quests(filename="data/quests.txt", workers=None):
+    """
+    Load quest data from file
+    filename may also be a directory of shard files (data/quests.d/*.txt),
+    which are parsed in parallel by up to `workers` processes.
+    """
+    if os.path.isdir(filename):
+        return load_shards(filename, "quest", workers)
 
     quests = {}
-    current_block = []
+    for quest in iter_quests(filename):
+        quests[quest['quest_id']] = quest
+    return quests
 
-    try:
-        with open(filename, 'r') as f:
-            lines = f.readlines()
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                if current_block:
-                    quest = parse_quest_block(current_block)
-                    validate_quest_data(quest)
-                    quests[quest['quest_id']] = quest
-                    current_block = []
-            else:
-                current_block.append(line)
+def load_items(filename="data/items.txt", workers=None):
+    """
+    Load item data from file
+    filename may also be a directory of shard files (data/items.d/*.txt),
+    which are parsed in parallel by up to `workers` processes.
+    """
+    if os.path.isdir(filename):
+        return load_shards(filename, "item", workers)
 
-        if current_block:
-            quest = parse_quest_block(current_block)
-            validate_quest_data(quest)
-            quests[quest['quest_id']] = quest
+    items = {}
+    for item in iter_items(filename):
+        items[item['item_id']] = item
+    return items
 
-    except IOError:
-        raise CorruptedDataError(f"Could not read file: {filename}")
-    except ValueError as e:
-        raise InvalidDataFormatError(f"Value error in quest data: {e}")
+def load_classes(filename="data/classes.txt"):
+    """Load character class definitions from file"""
+    classes = {}
+    for line_number, block in iter_data_blocks(filename):
+        character_class, errors = check_class_block(block, filename, line_number)
+        if errors:
+            raise InvalidDataFormatError("; ".join(errors))
+        if character_class['class_id'] in classes:
+            raise InvalidDataFormatError(
+                f"{filename}:{line_number}: duplicate class ID '{character_class['class_id']}'")
+        classes[character_class['class_id']] = character_class
+    return classes
 
-    return quests
+def iter_quests(filename="data/quests.txt"):
+    """
+    Yield validated quest dictionaries one block at a time
 
-def load_items(filename="data/items.txt"):
-    """Load item data from file"""
+    The file is read line by line, so each quest is available as soon as
+    its blank-line terminator is seen.
+    """
+    for line_number, block in iter_data_blocks(filename):
+        quest, errors = check_quest_block(block, filename, line_number)
+        if errors:
+            raise InvalidDataFormatError("; ".join(errors))
+        yield quest
+
+def iter_items(filename="data/items.txt"):
+    """
+    Yield validated item dictionaries one block at a time
+
+    The file is read line by line, so each item is available as soon as
+    its blank-line terminator is seen.
+    """
+    for line_number, block in iter_data_blocks(filename):
+        item, errors = check_item_block(block, filename, line_number)
+        if errors:
+            raise InvalidDataFormatError("; ".join(errors))
+        yield item
+
+def load_shards(directory, kind, workers=None):
+    """
+    Load every *.txt shard in a directory and merge them
+    Shards are parsed in a process pool. An ID defined in more than one shard
+    raises InvalidDataFormatError naming both files.
+    """
+    shard_files = list_shard_files(directory)
+    if not shard_files:
+        raise MissingDataFileError(f"No shard files found in {directory}")
+
+    if workers == 1 or len(shard_files) == 1:
+        results = [load_shard(path, kind) for path in shard_files]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(load_shard, shard_files, [kind] * len(shard_files)))
+
+    merged = {}
+    sources = {}
+    for path, shard in zip(shard_files, results):
+        for entry_id, entry in shard.items():
+            if entry_id in merged:
+                raise InvalidDataFormatError(
+                    f"Duplicate {kind} ID '{entry_id}' in {sources[entry_id]} and {path}")
+            merged[entry_id] = entry
+            sources[entry_id] = path
+    return merged
+
+def load_shard(path, kind):
+    """Load a single shard file (runs inside a worker process)"""
+    if kind == "quest":
+        return load_quests(path)
+    return load_items(path)
+
+def list_shard_files(directory):
+    """Get the shard files of a data directory in a stable order"""
+    return sorted(glob.glob(os.path.join(directory, "*.txt")))
+
+def get_default_data_path(name):
+    """Use data/<name>.d/ when it exists, otherwise data/<name>.txt"""
+    shard_directory = os.path.join("data", name + ".d")
+    if os.path.isdir(shard_directory):
+        return shard_directory
+    return os.path.join("data", name + ".txt")
+
+def load_quests_cached(filename="data/quests.txt"):
+    """Load quest data, using the compiled cache when it is fresh"""
+    return load_with_cache(filename, load_quests)
+
+def load_items_cached(filename="data/items.txt"):
+    """Load item data, using the compiled cache when it is fresh"""
+    return load_with_cache(filename, load_items)
+
+def load_with_cache(filename, loader):
+    """
+    Load data through a compiled sidecar cache
+    The cache lives in a .cache folder next to the source file and is keyed by
+    source path, mtime, size and CACHE_FORMAT_VERSION. A stale or unreadable
+    cache is rebuilt from the text file with loader().
+    """
     if not os.path.exists(filename):
-        raise MissingDataFileError(f"Item data file not found: {filename}")
+        raise MissingDataFileError(f"Data file not found: {filename}")
 
-    items = {}
-    current_block = []
+    cache_path = get_cache_path(filename)
+    key = get_cache_key(filename)
+
+    data = read_cache(cache_path, key)
+    if data is not None:
+        return data
+
+    data = loader(filename)
+    write_cache(cache_path, key, data)
+    return data
 
+def get_cache_path(filename):
+    """Get the compiled cache path for a data file (data/.cache/quests.bin)"""
+    directory, base = os.path.split(os.path.normpath(filename))
+    if os.path.isdir(filename):
+        stem = base  # data/quests.d -> data/.cache/quests.d.bin
+    else:
+        stem = os.path.splitext(base)[0]
+    return os.path.join(directory, CACHE_DIRECTORY_NAME, stem + ".bin")
+
+def get_cache_key(filename):
+    """
+    Build the freshness key that a cache file must match
+    For a shard directory every shard's mtime and size is part of the key.
+    """
+    if os.path.isdir(filename):
+        sources = list_shard_files(filename)
+    else:
+        sources = [filename]
+
+    files = []
+    for path in sources:
+        stat = os.stat(path)
+        files.append((os.path.abspath(path), stat.st_mtime_ns, stat.st_size))
+
+    return {
+        "version": CACHE_FORMAT_VERSION,
+        "source": os.path.abspath(filename),
+        "files": files
+    }
+
+def read_cache(cache_path, key):
+    """Return cached data if the cache matches key, otherwise None"""
     try:
-        with open(filename, 'r') as f:
-            lines = f.readlines()
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                if current_block:
-                    item = parse_item_block(current_block)
-                    validate_item_data(item)
-                    items[item['item_id']] = item
-                    current_block = []
-            else:
-                current_block.append(line)
+        with open(cache_path, 'rb') as f:
+            # The header is pickled separately so a stale cache is detected
+            # without unpickling the whole catalog
+            header = pickle.load(f)
+            if header != key:
+                return None
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        return None
+
+def write_cache(cache_path, key, data):
+    """Write a cache file; failures are ignored since the cache is optional"""
+    temp_path = cache_path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+    return True
 
-        if current_block:
-            item = parse_item_block(current_block)
-            validate_item_data(item)
-            items[item['item_id']] = item
+# ============================================================================
+# LAZY ITEM CATALOG
+# ============================================================================
 
-    except IOError:
-        raise CorruptedDataError(f"Could not read file: {filename}")
-    except ValueError as e:
-        raise InvalidDataFormatError(f"Value error in item data: {e}")
+class ItemCatalog(Mapping):
+    """
+    Read-only, memory-mapped item catalog
+    Opening the catalog only builds an item_id -> byte range index. Each item
+    is parsed and validated the first time it is looked up, so resident
+    memory stays close to the index size. Works anywhere an item dict is
+    expected (catalog[item_id], item_id in catalog, .items(), .get()).
+    """
 
-    return items
+    def __init__(self, filename="data/items.txt"):
+        if not os.path.exists(filename):
+            raise MissingDataFileError(f"Item data file not found: {filename}")
+
+        self.filename = filename
+        self._parsed = {}
+        self._mmap = None
+
+        try:
+            self._file = open(filename, 'rb')
+            if os.path.getsize(filename) > 0:
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (IOError, ValueError):
+            raise CorruptedDataError(f"Could not read file: {filename}")
+
+        self._index = build_item_offset_index(self._mmap) if self._mmap else {}
+
+    def __getitem__(self, item_id):
+        item = self._parsed.get(item_id)
+        if item is None:
+            start, end, line_number = self._index[item_id]
+            lines = []
+            for line in self._mmap[start:end].decode().splitlines():
+                line = line.strip()
+                if line:
+                    lines.append(line)
+            item, errors = check_item_block(lines, self.filename, line_number)
+            if errors:
+                raise InvalidDataFormatError("; ".join(errors))
+            self._parsed[item_id] = item
+        return item
+
+    def __contains__(self, item_id):
+        return item_id in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def close(self):
+        """Release the memory map and file handle"""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def build_item_offset_index(data):
+    """
+    Scan raw item file bytes once and map each ITEM_ID to its (start, end,
+    line_number) byte range and first line. Items are not parsed here.
+    """
+    index = {}
+    position = 0
+    line_number = 0
+    block_start = None
+    block_line = None
+    block_id = None
+    size = len(data)
+
+    while position < size:
+        line_end = data.find(b"\n", position)
+        if line_end == -1:
+            line_end = size
+        line = data[position:line_end].strip()
+        line_number += 1
+
+        if not line:
+            if block_start is not None:
+                if block_id is not None:
+                    index[block_id] = (block_start, position, block_line)
+                block_start = None
+                block_id = None
+        else:
+            if block_start is None:
+                block_start = position
+                block_line = line_number
+            if line.startswith(b"ITEM_ID:"):
+                block_id = line[8:].strip().decode()
+
+        position = line_end + 1
+
+    if block_start is not None and block_id is not None:
+        index[block_id] = (block_start, size, block_line)
+
+    return index
+
+# ============================================================================
+# HOT RELOAD
+# ============================================================================
+
+class DataFileWatcher:
+    """
+    Poll a quest or item file and patch an already loaded dict in place
+    Only blocks whose text changed are re-parsed. generation goes up by one
+    every time the dict is patched, so anything built from the old data can
+    compare generations to know when to rebuild.
+    """
+
+    def __init__(self, filename, data, kind):
+        if kind == "quest":
+            self.id_key = "QUEST_ID"
+            self.check_block = check_quest_block
+        elif kind == "item":
+            self.id_key = "ITEM_ID"
+            self.check_block = check_item_block
+        else:
+            raise ValueError(f"Unknown data kind: {kind}")
+
+        self.filename = filename
+        self.data = data
+        self.kind = kind
+        self.generation = 0
+        self._signature = get_file_signature(filename)
+        self._block_hashes = self.read_block_hashes()
+
+    def read_block_hashes(self):
+        """Map each block id to a hash of its raw lines without parsing it"""
+        hashes = {}
+        for line_number, block in iter_data_blocks(self.filename):
+            hashes[self.get_block_id(block, line_number)] = hash(tuple(block))
+        return hashes
+
+    def get_block_id(self, block, line_number):
+        """Find the id line of a raw block"""
+        prefix = self.id_key + ":"
+        for line in block:
+            if line.startswith(prefix):
+                return line[len(prefix):].strip()
+        raise InvalidDataFormatError(
+            f"{self.filename} line {line_number}: block has no {self.id_key}")
+
+    def poll(self):
+        """
+        Check the file and apply any changes
+        Returns True if self.data was patched. If the new file is invalid the
+        old data is kept and InvalidDataFormatError is raised once.
+        """
+        try:
+            signature = get_file_signature(self.filename)
+        except OSError:
+            return False  # File is being replaced; try again next poll
+        if signature == self._signature:
+            return False
+        self._signature = signature
+
+        new_hashes = {}
+        changed = {}
+        for line_number, block in iter_data_blocks(self.filename):
+            block_id = self.get_block_id(block, line_number)
+            block_hash = hash(tuple(block))
+            new_hashes[block_id] = block_hash
+
+            if self._block_hashes.get(block_id) != block_hash:
+                entry, errors = self.check_block(block, self.filename, line_number)
+                if errors:
+                    raise InvalidDataFormatError("; ".join(errors))
+                changed[block_id] = entry
+
+        removed = [block_id for block_id in self._block_hashes if block_id not in new_hashes]
+        self._block_hashes = new_hashes
+
+        if not changed and not removed:
+            return False
+
+        for block_id in removed:
+            self.data.pop(block_id, None)
+        self.data.update(changed)
+        self.generation += 1
+        return True
+
+def get_file_signature(filename):
+    """Return (mtime, size) used to detect that a file changed"""
+    stat = os.stat(filename)
+    return (stat.st_mtime_ns, stat.st_size)
+
+# ============================================================================
+# SCHEMA VALIDATION
+# ============================================================================
+
+def compile_schema(schema, derived=None):
+    """
+    Compile a declarative schema into a per-block checker
+    The checker takes raw block lines and returns (entry, errors), where
+    errors is a list of "file:line: message" strings. It never raises, so a
+    whole file can be checked in one pass.
+    derived maps an extra field to (source_field, compile_function); the
+    function's result is stored alongside the entry and a ValueError from it
+    is reported as an error for the source line.
+    """
+    fields = {}
+    for name, kind in schema.items():
+        fields[name.upper()] = (name, kind)
+    required = tuple(schema)
+    derived = derived or {}
+
+    def check_block(lines, filename="<data>", start_line=1):
+        entry = {}
+        errors = []
+        seen = set()
+        lines_by_field = {}
+
+        for offset, line in enumerate(lines):
+            key, separator, value = line.partition(":")
+            if not separator:
+                errors.append(f"{filename}:{start_line + offset}: expected 'KEY: value', got {line!r}")
+                continue
+            key = key.strip()
+            value = value.strip()
+
+            rule = fields.get(key)
+            if rule is None:
+                entry[key.lower()] = value  # Unknown keys are kept as text
+                continue
+
+            name, kind = rule
+            seen.add(name)
+            if kind is int:
+                try:
+                    value = int(value)
+                except ValueError:
+                    errors.append(f"{filename}:{start_line + offset}: {key} must be an integer, got {value!r}")
+                    continue
+            elif isinstance(kind, tuple) and value not in kind:
+                errors.append(f"{filename}:{start_line + offset}: {key} must be one of {list(kind)}, got {value!r}")
+                continue
+            entry[name] = value
+            lines_by_field[name] = start_line + offset
+
+        for name in required:
+            if name not in seen:
+                errors.append(f"{filename}:{start_line}: block missing required field {name.upper()}")
+
+        for name, (source, compile_value) in derived.items():
+            if source in entry:
+                try:
+                    entry[name] = compile_value(entry[source])
+                except ValueError as e:
+                    errors.append(f"{filename}:{lines_by_field[source]}: {e}")
+
+        return entry, errors
+
+    return check_block
+
+def compile_item_effect(effect_string):
+    """
+    Compile an effect string once at load time
+    Example: "health:20" -> ("health", 20). Raises ValueError if malformed.
+    """
+    stat_name, separator, value = effect_string.partition(":")
+    stat_name = stat_name.strip()
+    if not separator or stat_name not in EFFECT_STATS:
+        raise ValueError(f"EFFECT must look like 'stat:value' with stat in {list(EFFECT_STATS)}, got {effect_string!r}")
+    try:
+        return (stat_name, int(value))
+    except ValueError:
+        raise ValueError(f"EFFECT value must be an integer, got {effect_string!r}")
+
+check_quest_block = compile_schema(QUEST_SCHEMA)
+check_item_block = compile_schema(ITEM_SCHEMA, {"compiled_effect": ("effect", compile_item_effect)})
+check_class_block = compile_schema(CLASS_SCHEMA)
+
+# kind -> (block checker, ID field) for validate_data_file
+DATA_KINDS = {
+    "quest": (check_quest_block, "quest_id"),
+    "item": (check_item_block, "item_id"),
+    "class": (check_class_block, "class_id")
+}
+
+def validate_data_file(filename, kind):
+    """
+    Validate a quest, item or class file (or shard directory) in one pass
+    Returns a list of every error found, including duplicate IDs. Nothing is
+    kept in memory beyond the IDs seen so far.
+    """
+    check_block, id_field = DATA_KINDS[kind]
+
+    if os.path.isdir(filename):
+        paths = list_shard_files(filename)
+    else:
+        paths = [filename]
+
+    errors = []
+    first_seen = {}
+    for path in paths:
+        for line_number, block in iter_data_blocks(path):
+            entry, block_errors = check_block(block, path, line_number)
+            errors.extend(block_errors)
+
+            entry_id = entry.get(id_field)
+            if entry_id is None:
+                continue
+            if entry_id in first_seen:
+                errors.append(f"{path}:{line_number}: duplicate {kind} ID '{entry_id}' (first defined at {first_seen[entry_id]})")
+            else:
+                first_seen[entry_id] = f"{path}:{line_number}"
+    return errors
 
 def validate_quest_data(quest_dict):
     """Validate that quest dictionary has all required fields"""
-    required_fields = [
-        "quest_id", "title", "description", "reward_xp", 
-        "reward_gold", "required_level", "prerequisite"
-    ]
-    for field in required_fields:
-        if field not in quest_dict:
-            raise InvalidDataFormatError(f"Quest missing required field: {field}")
-    return True
+    return validate_against_schema(quest_dict, QUEST_SCHEMA, "Quest")
 
 def validate_item_data(item_dict):
     """Validate that item dictionary has all required fields"""
-    required_fields = ["item_id", "name", "type", "effect", "cost", "description"]
-    for field in required_fields:
-        if field not in item_dict:
-            raise InvalidDataFormatError(f"Item missing required field: {field}")
+    return validate_against_schema(item_dict, ITEM_SCHEMA, "Item")
+
+def validate_against_schema(data_dict, schema, label):
+    """Raise InvalidDataFormatError for the first missing or mistyped field"""
+    for field, kind in schema.items():
+        if field not in data_dict:
+            raise InvalidDataFormatError(f"{label} missing required field: {field}")
+        value = data_dict[field]
+        if kind is int and not isinstance(value, int):
+            raise InvalidDataFormatError(f"{label} field {field} must be an integer")
+        if isinstance(kind, tuple) and value not in kind:
+            raise InvalidDataFormatError(f"{label} field {field} must be one of {list(kind)}")
     return True
 
 def create_default_data_files():
@@ -130,10 +621,69 @@ def create_default_data_files():
         with open("data/items.txt", 'w') as f:
             f.write("ITEM_ID: potion\nNAME: Potion\nTYPE: consumable\nEFFECT: health:20\nCOST: 10\nDESCRIPTION: Heals 20 HP.\n")
 
+    # Default Classes
+    if not os.path.exists("data/classes.txt"):
+        with open("data/classes.txt", 'w') as f:
+            f.write(DEFAULT_CLASSES_TEXT)
+
+DEFAULT_CLASSES_TEXT = """CLASS_ID: Warrior
+HEALTH: 120
+STRENGTH: 15
+MAGIC: 5
+GOLD: 100
+
+CLASS_ID: Mage
+HEALTH: 80
+STRENGTH: 8
+MAGIC: 20
+GOLD: 100
+
+CLASS_ID: Rogue
+HEALTH: 90
+STRENGTH: 12
+MAGIC: 10
+GOLD: 100
+
+CLASS_ID: Cleric
+HEALTH: 100
+STRENGTH: 10
+MAGIC: 15
+GOLD: 100
+"""
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+def iter_data_blocks(filename):
+    """
+    Yield (line_number, lines) for each blank-line separated block in a file
+    line_number is where the block starts (1-based) and lines are stripped.
+    """
+    if not os.path.exists(filename):
+        raise MissingDataFileError(f"Data file not found: {filename}")
+
+    current_block = []
+    start_line = 0
+
+    try:
+        with open(filename, 'r') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    if current_block:
+                        yield start_line, current_block
+                        current_block = []
+                else:
+                    if not current_block:
+                        start_line = line_number
+                    current_block.append(line)
+    except IOError:
+        raise CorruptedDataError(f"Could not read file: {filename}")
+
+    if current_block:
+        yield start_line, current_block
+
 def parse_quest_block(lines):
     quest = {}
     for line in lines:
@@ -159,3 +709,41 @@ def parse_item_block(lines):
             else:
                 item[key.lower()] = value
     return item
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Load or validate Quest Chronicles data files")
+    parser.add_argument("--quests", default=get_default_data_path("quests"))
+    parser.add_argument("--items", default=get_default_data_path("items"))
+    parser.add_argument("--classes", default="data/classes.txt")
+    parser.add_argument("--validate-only", action="store_true",
+                        help="Check every block and report all errors without building the catalogs")
+    args = parser.parse_args()
+
+    if args.validate_only:
+        all_errors = []
+        for path, kind in [(args.quests, "quest"), (args.items, "item"), (args.classes, "class")]:
+            if kind == "class" and not os.path.exists(path):
+                continue  # Optional: built-in classes are used without it
+            try:
+                all_errors.extend(validate_data_file(path, kind))
+            except (MissingDataFileError, CorruptedDataError) as e:
+                all_errors.append(str(e))
+        for error in all_errors:
+            print(error)
+        print(f"{len(all_errors)} error(s) found.")
+        sys.exit(1 if all_errors else 0)
+
+    try:
+        quests = load_quests(args.quests)
+        items = load_items(args.items)
+    except (MissingDataFileError, CorruptedDataError, InvalidDataFormatError) as e:
+        print(f"Error loading game data: {e}")
+        sys.exit(1)
+    print(f"Loaded {len(quests)} quests and {len(items)} items.")
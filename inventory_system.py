@@ -9,6 +9,8 @@ AI Usage: Ai used to fix my spelling erros
 This module handles inventory management, item usage, and equipment.
 """
 
+from array import array
+from bisect import bisect_right
 from custom_exceptions import (
     InventoryFullError,
     ItemNotFoundError,
@@ -84,6 +86,17 @@ def parse_item_effect(effect_string):
     except ValueError:
         return None, 0
 
+def get_item_effect(item_data):
+    """
+    Get (stat name, value) for an item
+    Items loaded through game_data carry a precompiled 'compiled_effect';
+    plain item dicts fall back to parsing the effect string.
+    """
+    compiled = item_data.get('compiled_effect')
+    if compiled is not None:
+        return compiled
+    return parse_item_effect(item_data.get('effect', ''))
+
 def apply_stat_effect(character, stat_name, value):
     """
     Apply a stat modification to character
@@ -112,8 +125,7 @@ def use_item(character, item_id, item_data):
     if item_data.get('type') != 'consumable':
         raise InvalidItemTypeError(f"{item_id} is not a consumable item.")
         
-    effect_str = item_data.get('effect', '')
-    stat_name, value = parse_item_effect(effect_str)
+    stat_name, value = get_item_effect(item_data)
     
     apply_stat_effect(character, stat_name, value)
     character['inventory'].remove(item_id)
@@ -135,8 +147,7 @@ def equip_weapon(character, item_id, item_data):
         unequip_weapon(character)
         
     # Apply stats
-    effect_str = item_data.get('effect', '')
-    stat_name, value = parse_item_effect(effect_str)
+    stat_name, value = get_item_effect(item_data)
     apply_stat_effect(character, stat_name, value)
     
     # Set equipped weapon and remove from inventory
@@ -160,8 +171,7 @@ def equip_armor(character, item_id, item_data):
         unequip_armor(character)
         
     # Apply stats
-    effect_str = item_data.get('effect', '')
-    stat_name, value = parse_item_effect(effect_str)
+    stat_name, value = get_item_effect(item_data)
     
     # If armor increases max_health, we just add it. 
     # Current health stays same unless we heal.
@@ -241,6 +251,58 @@ def sell_item(character, item_id, item_data):
     character['gold'] += sell_price
     return sell_price
 
+class ShopCatalog:
+    """
+    Columnar, cost-sorted view of an item catalog for shop queries
+    Costs are stored in an array next to an id list, both sorted by cost,
+    plus one id list and cost column per item type. A query such as
+    "weapons under 200 gold" is a binary search plus a slice, so it does not
+    touch every item.
+    Building the catalog reads every item's cost and type, so with a lazy
+    game_data.ItemCatalog it parses every item once.
+    """
+
+    def __init__(self, item_data_dict):
+        rows = sorted((item['cost'], item_id, item['type'])
+                      for item_id, item in item_data_dict.items())
+
+        self.type_names = sorted(set(row[2] for row in rows))
+
+        self.ids = [row[1] for row in rows]
+        self.costs = array('q', [row[0] for row in rows])
+
+        self.ids_by_type = {name: [] for name in self.type_names}
+        self.costs_by_type = {name: array('q') for name in self.type_names}
+        for cost, item_id, item_type in rows:
+            self.ids_by_type[item_type].append(item_id)
+            self.costs_by_type[item_type].append(cost)
+
+    def get_columns(self, item_type=None):
+        """Get the (ids, costs) columns for one type or for every item"""
+        if item_type is None:
+            return self.ids, self.costs
+        if item_type not in self.ids_by_type:
+            return [], array('q')
+        return self.ids_by_type[item_type], self.costs_by_type[item_type]
+
+    def count(self, item_type=None, max_cost=None):
+        """Count items matching the filters"""
+        ids, costs = self.get_columns(item_type)
+        if max_cost is None:
+            return len(ids)
+        return bisect_right(costs, max_cost)
+
+    def query(self, item_type=None, max_cost=None, offset=0, limit=None):
+        """
+        Get item ids matching the filters, cheapest first
+        Example: query("weapon", 200) -> weapons costing 200 gold or less
+        """
+        ids, costs = self.get_columns(item_type)
+        end = len(ids) if max_cost is None else bisect_right(costs, max_cost)
+        if limit is not None:
+            end = min(end, offset + limit)
+        return ids[offset:end]
+
 def display_inventory(character, item_data_dict):
     """
     Display character's inventory in formatted way
@@ -11,6 +11,9 @@ Demonstrates module integration and complete game flow.
 """
 #checking if test cases fail again
 
+import os
+import time
+
 # Import all our custom modules
 import character_manager
 import inventory_system
@@ -47,6 +50,33 @@ all_quests = {}
 all_items = {}
 game_running = False
 
+# Autosave policy: after an action, save at most every AUTOSAVE_INTERVAL_SECONDS
+# or every AUTOSAVE_MAX_ACTIONS actions, whichever comes first. Quitting and
+# dying always save. Nothing is written if the character did not change.
+AUTOSAVE_INTERVAL_SECONDS = 30
+AUTOSAVE_MAX_ACTIONS = 5
+actions_since_save = 0
+last_save_time = 0.0
+
+# Saves are written by a background thread so the game loop never waits on
+# the disk; save_game(wait=True) is used where the save must be finished.
+save_writer = None
+
+# Hot reload: watchers patch all_quests/all_items in place when the data files
+# change. data_generation goes up on every reload so caches built from the old
+# data know to rebuild.
+data_watchers = []
+data_generation = 0
+
+# Shop view over all_items, rebuilt when data_generation changes
+SHOP_PAGE_SIZE = 10
+shop_catalog = None
+shop_catalog_generation = -1
+
+# Quest availability index over all_quests, rebuilt when data_generation changes
+quest_index = None
+quest_index_generation = -1
+
 # ============================================================================
 # MAIN MENU
 # ============================================================================
@@ -74,7 +104,7 @@ def new_game():
     
     print("\n=== NEW GAME ===")
     name = input("Enter character name: ")
-    print("Available Classes: Warrior, Mage, Rogue, Cleric")
+    print(f"Available Classes: {', '.join(character_manager.get_class_names())}")
     char_class = input("Enter character class: ").strip().capitalize()
     
     try:
@@ -92,19 +122,19 @@ def load_game():
     global current_character
     
     print("\n=== LOAD GAME ===")
-    saved_chars = character_manager.list_saved_characters()
+    saved_chars = character_manager.list_character_summaries()
     
     if not saved_chars:
         print("No saved games found.")
         return
         
-    for i, name in enumerate(saved_chars, 1):
-        print(f"{i}. {name}")
+    for i, summary in enumerate(saved_chars, 1):
+        print(f"{i}. {summary['name']} - Level {summary['level']} {summary['class']}, {summary['gold']} Gold")
         
     try:
         choice = int(input("Select character number: "))
         if 1 <= choice <= len(saved_chars):
-            char_name = saved_chars[choice - 1]
+            char_name = saved_chars[choice - 1]['name']
             current_character = character_manager.load_character(char_name)
             print(f"\nLoaded {char_name} successfully!")
             game_loop()
@@ -128,6 +158,7 @@ def game_loop():
     game_running = True
     
     while game_running:
+        check_for_data_updates()
         choice = game_menu()
         
         if choice == 1:
@@ -141,7 +172,7 @@ def game_loop():
         elif choice == 5:
             shop()
         elif choice == 6:
-            save_game()
+            save_game(wait=True)
             print("Game saved. Returning to Main Menu.")
             game_running = False
         else:
@@ -149,7 +180,7 @@ def game_loop():
             
         # Autosave after action
         if game_running and current_character:
-            save_game()
+            autosave()
 
 def game_menu():
     """
@@ -219,6 +250,15 @@ def view_inventory():
     except (ItemNotFoundError, InvalidItemTypeError, InventoryFullError) as e:
         print(f"Error: {e}")
 
+def get_quest_index():
+    """Get the quest availability index, rebuilding it after a data reload"""
+    global quest_index, quest_index_generation
+    
+    if quest_index is None or quest_index_generation != data_generation:
+        quest_index = quest_handler.build_quest_index(all_quests)
+        quest_index_generation = data_generation
+    return quest_index
+
 def quest_menu():
     """Quest management menu"""
     global current_character, all_quests
@@ -233,7 +273,7 @@ def quest_menu():
     try:
         choice = int(input("Choice: "))
         if choice == 1:
-            avail = quest_handler.get_available_quests(current_character, all_quests)
+            avail = quest_handler.get_available_quests(current_character, all_quests, get_quest_index())
             quest_handler.display_quest_list(avail)
         elif choice == 2:
             qid = input("Enter Quest ID to accept: ")
@@ -282,19 +322,54 @@ def explore():
     except CombatNotActiveError as e:
         print(f"Combat ended: {e}")
 
+def get_shop_catalog():
+    """Get the shop's columnar item view, rebuilding it after a data reload"""
+    global shop_catalog, shop_catalog_generation
+    
+    if shop_catalog is None or shop_catalog_generation != data_generation:
+        shop_catalog = inventory_system.ShopCatalog(all_items)
+        shop_catalog_generation = data_generation
+    return shop_catalog
+
 def shop():
     """Shop menu for buying/selling items"""
     global current_character, all_items
     
-    print("\n=== SHOP ===")
-    print(f"Your Gold: {current_character['gold']}")
-    print("Items for Sale:")
+    catalog = get_shop_catalog()
+    item_type = None
+    affordable_only = False
+    page = 0
     
-    for i_id, i_data in all_items.items():
-        print(f"- {i_data['name']} ({i_data['type']}): {i_data['cost']} Gold (ID: {i_id})")
+    while True:
+        max_cost = current_character['gold'] if affordable_only else None
+        total = catalog.count(item_type, max_cost)
+        page_count = max(1, (total + SHOP_PAGE_SIZE - 1) // SHOP_PAGE_SIZE)
+        page = min(page, page_count - 1)
         
-    print("\nOptions: [B]uy, [S]ell, [E]xit")
-    choice = input("Choice: ").upper()
+        print("\n=== SHOP ===")
+        print(f"Your Gold: {current_character['gold']}")
+        print(f"Items for Sale (showing: {item_type or 'all'}{', affordable' if affordable_only else ''}):")
+        
+        for i_id in catalog.query(item_type, max_cost, page * SHOP_PAGE_SIZE, SHOP_PAGE_SIZE):
+            i_data = all_items[i_id]
+            print(f"- {i_data['name']} ({i_data['type']}): {i_data['cost']} Gold (ID: {i_id})")
+        print(f"Page {page + 1}/{page_count}")
+        
+        print("\nOptions: [B]uy, [S]ell, [N]ext Page, [P]revious Page, [F]ilter, [E]xit")
+        choice = input("Choice: ").upper()
+        
+        if choice == 'N':
+            page += 1
+        elif choice == 'P':
+            page = max(0, page - 1)
+        elif choice == 'F':
+            print(f"Types: all, {', '.join(catalog.type_names)}")
+            chosen = input("Show which type? ").strip().lower()
+            item_type = chosen if chosen in catalog.type_names else None
+            affordable_only = input("Only items you can afford? (y/n): ").strip().lower() == 'y'
+            page = 0
+        else:
+            break
     
     if choice == 'B':
         item_id = input("Enter Item ID to buy: ")
@@ -317,18 +392,72 @@ def shop():
             except ItemNotFoundError as e:
                 print(f"Error: {e}")
 
-def save_game():
-    """Save current game state"""
-    global current_character
-    if current_character:
-        character_manager.save_character(current_character)
+def save_game(wait=False):
+    """
+    Save current game state (skipped if nothing changed)
+    The write happens in the background; wait=True blocks until it is done.
+    """
+    global current_character, actions_since_save, last_save_time, save_writer
+    
+    if save_writer is None:
+        save_writer = character_manager.SaveWriter()
+    
+    if current_character and character_manager.is_character_dirty(current_character):
+        save_writer.submit(current_character)
+    actions_since_save = 0
+    last_save_time = time.monotonic()
+    
+    if wait:
+        for error in save_writer.flush():
+            print(f"Warning: could not save game: {error}")
+
+def autosave():
+    """Count an action and save once the autosave policy says it is due"""
+    global actions_since_save
+    
+    actions_since_save += 1
+    if (actions_since_save >= AUTOSAVE_MAX_ACTIONS
+            or time.monotonic() - last_save_time >= AUTOSAVE_INTERVAL_SECONDS):
+        save_game()
+
+def load_game_data(lazy_items=False):
+    """
+    Load all quest, item and class data from files
+    lazy_items=True uses a memory-mapped ItemCatalog for very large item files
+    (opening the shop still parses every item once to build its catalog)
+    """
+    global all_quests, all_items, data_watchers
+    
+    # A data/quests.d/ or data/items.d/ shard directory takes priority over the single file
+    quest_path = game_data.get_default_data_path("quests")
+    item_path = game_data.get_default_data_path("items")
+    data_watchers = []
+    
+    all_quests = game_data.load_quests_cached(quest_path)
+    if os.path.isfile(quest_path):
+        data_watchers.append(game_data.DataFileWatcher(quest_path, all_quests, "quest"))
+    
+    if lazy_items and os.path.isfile(item_path):
+        all_items = game_data.ItemCatalog(item_path)
+    else:
+        all_items = game_data.load_items_cached(item_path)
+        if os.path.isfile(item_path):
+            data_watchers.append(game_data.DataFileWatcher(item_path, all_items, "item"))
+    
+    # Classes are loaded here so a malformed data/classes.txt is reported at startup
+    character_manager.load_class_prototypes()
 
-def load_game_data():
-    """Load all quest and item data from files"""
-    global all_quests, all_items
+def check_for_data_updates():
+    """Poll the data files and apply any edits made while the game is running"""
+    global data_generation
     
-    all_quests = game_data.load_quests()
-    all_items = game_data.load_items()
+    for watcher in data_watchers:
+        try:
+            if watcher.poll():
+                data_generation += 1
+                print(f"[Game data reloaded: {watcher.filename}]")
+        except (InvalidDataFormatError, CorruptedDataError, MissingDataFileError) as e:
+            print(f"[Ignoring bad data file update: {e}]")
 
 def handle_character_death():
     """Handle character death"""
@@ -344,11 +473,13 @@ def handle_character_death():
         if character_manager.revive_character(current_character):
             print("You have been revived at 50% health.")
             # Penalty logic could go here
-            save_game()
         else:
             print("Error reviving.")
     else:
         game_running = False
+    
+    # Always save on death, whether the player revives or quits
+    save_game(wait=True)
 
 def display_welcome():
     """Display welcome message"""
@@ -359,6 +490,11 @@ def display_welcome():
     print("Build your character, complete quests, and become a legend!")
     print()
 
+def display_level_up(character, old_level, new_level):
+    """Level-up listener: print a banner for each level gained"""
+    for level in range(old_level + 1, new_level + 1):
+        print(f"*** LEVEL UP! {character['name']} is now level {level}! ***")
+
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
@@ -368,6 +504,7 @@ def main():
     
     # Display welcome message
     display_welcome()
+    character_manager.add_level_up_listener(display_level_up)
     
     # Load game data
     try:
@@ -391,6 +528,8 @@ def main():
         elif choice == 2:
             load_game()
         elif choice == 3:
+            if save_writer is not None:
+                save_writer.close()
             print("\nThanks for playing Quest Chronicles!")
             break
         else:
@@ -96,13 +96,69 @@ def get_completed_quests(character, quest_data_dict):
             completed_data.append(quest_data_dict[q_id])
     return completed_data
 
-def get_available_quests(character, quest_data_dict):
-    """Get quests that character can currently accept"""
-    available = []
-    for q_id, q_data in quest_data_dict.items():
-        if can_accept_quest(character, q_id, quest_data_dict):
-            available.append(q_data)
-    return available
+def get_available_quests(character, quest_data_dict, quest_index=None):
+    """
+    Get quests that character can currently accept
+    With a quest_index from build_quest_index() only quests that could have
+    unlocked are checked: prerequisite-free quests up to the character's level
+    and the dependents of completed quests.
+    """
+    if quest_index is None:
+        available = []
+        for q_id, q_data in quest_data_dict.items():
+            if can_accept_quest(character, q_id, quest_data_dict):
+                available.append(q_data)
+        return available
+
+    level = character['level']
+    active = set(character['active_quests'])
+    completed = set(character['completed_quests'])
+
+    candidates = []
+    for required_level in quest_index['root_levels']:
+        if required_level > level:
+            break
+        candidates.extend(quest_index['roots_by_level'][required_level])
+    for q_id in completed:
+        candidates.extend(quest_index['dependents'].get(q_id, []))
+
+    available_ids = []
+    for q_id in candidates:
+        if q_id in active or q_id in completed:
+            continue
+        if quest_data_dict[q_id]['required_level'] <= level:
+            available_ids.append(q_id)
+
+    # Keep catalog order, same as the unindexed path
+    available_ids.sort(key=quest_index['order'].get)
+    return [quest_data_dict[q_id] for q_id in available_ids]
+
+def build_quest_index(quest_data_dict):
+    """
+    Build lookup tables for get_available_quests
+    roots_by_level: required_level -> quest ids with no prerequisite
+    root_levels: sorted keys of roots_by_level
+    dependents: prerequisite quest id -> quest ids that require it
+    order: quest id -> position in the catalog
+    """
+    roots_by_level = {}
+    dependents = {}
+    order = {}
+
+    for position, (q_id, q_data) in enumerate(quest_data_dict.items()):
+        order[q_id] = position
+        prereq = q_data.get('prerequisite', 'NONE')
+        if prereq == "NONE":
+            roots_by_level.setdefault(q_data['required_level'], []).append(q_id)
+        else:
+            dependents.setdefault(prereq, []).append(q_id)
+
+    return {
+        'root_levels': sorted(roots_by_level),
+        'roots_by_level': roots_by_level,
+        'dependents': dependents,
+        'order': order
+    }
 
 # ============================================================================
 # QUEST TRACKING
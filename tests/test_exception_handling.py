@@ -160,6 +160,30 @@ def test_invalid_data_format_exception():
     finally:
         os.remove("test_bad_data.txt")
 
+def test_batch_validator_reports_all_errors(tmp_path):
+    """Test that validate_data_file collects every error with line numbers"""
+    bad_file = tmp_path / "quests.txt"
+    bad_file.write_text("QUEST_ID: a\nTITLE: A\nDESCRIPTION: x\nREWARD_XP: lots\n"
+                        "REWARD_GOLD: 1\nREQUIRED_LEVEL: 1\nPREREQUISITE: NONE\n\n"
+                        "QUEST_ID: b\nTITLE: B\n")
+    
+    errors = game_data.validate_data_file(str(bad_file), "quest")
+    assert any(":4: REWARD_XP must be an integer" in e for e in errors)
+    assert any(":9: block missing required field DESCRIPTION" in e for e in errors)
+    assert len(errors) == 6
+    
+    with pytest.raises(InvalidDataFormatError):
+        game_data.load_quests(str(bad_file))
+
+def test_malformed_item_effect_rejected_at_load(tmp_path):
+    """Test that bad EFFECT strings fail at load instead of becoming (None, 0)"""
+    bad_file = tmp_path / "items.txt"
+    bad_file.write_text("ITEM_ID: junk\nNAME: Junk\nTYPE: consumable\n"
+                        "EFFECT: health-20\nCOST: 1\nDESCRIPTION: Broken\n")
+    
+    with pytest.raises(InvalidDataFormatError):
+        game_data.load_items(str(bad_file))
+
 # ============================================================================
 # COMBAT EXCEPTION TESTS
 # ============================================================================
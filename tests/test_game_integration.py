@@ -40,6 +40,308 @@ def test_character_creation_and_saving():
     # Cleanup
     character_manager.delete_character("IntegrationTest")
 
+def test_slotted_character_type(tmp_path):
+    """Test that Character behaves like the old character dicts"""
+    char = character_manager.create_character("SlotTest", "Mage")
+    assert isinstance(char, character_manager.Character)
+    assert char.magic == char['magic'] == 20
+    assert 'equipped_weapon' not in char
+    assert char.get('equipped_weapon') is None
+    
+    inventory_system.add_item_to_inventory(char, "iron_sword")
+    inventory_system.equip_weapon(char, "iron_sword", {'type': 'weapon', 'effect': 'strength:5'})
+    assert char['equipped_weapon'] == "iron_sword"
+    assert 'equipped_weapon' in char
+    
+    with pytest.raises(KeyError):
+        char['helth'] = 10
+    for key in ['keys', 'copy', '__slots__']:  # Methods and internals are not fields
+        with pytest.raises(KeyError):
+            char[key]
+    
+    character_manager.save_character(char, str(tmp_path))
+    loaded = character_manager.load_character("SlotTest", str(tmp_path))
+    assert isinstance(loaded, character_manager.Character)
+    del char['equipped_weapon']
+    assert loaded == char == dict(char)
+
+def test_data_driven_classes(tmp_path):
+    """Test classes loaded from a data file and bulk character creation"""
+    classes_file = tmp_path / "classes.txt"
+    classes_file.write_text(game_data.DEFAULT_CLASSES_TEXT +
+                            "\nCLASS_ID: Paladin\nHEALTH: 110\nSTRENGTH: 13\nMAGIC: 9\nGOLD: 50\n")
+    try:
+        character_manager.load_class_prototypes(str(classes_file))
+        assert "Paladin" in character_manager.get_class_names()
+        
+        party = character_manager.create_characters([(f"P{i}", "Paladin") for i in range(3)])
+        assert [c['max_health'] for c in party] == [110, 110, 110]
+        assert party[0]['gold'] == 50
+        party[0]['inventory'].append("iron_sword")
+        assert party[1]['inventory'] == []  # Clones do not share lists
+        
+        from custom_exceptions import InvalidCharacterClassError
+        with pytest.raises(InvalidCharacterClassError):
+            character_manager.create_characters([("Ok", "Mage"), ("Bad", "Bard")])
+    finally:
+        character_manager.load_class_prototypes()
+    
+    assert character_manager.create_character("Back", "Warrior")['health'] == 120
+
+def test_bad_classes_file_reported_at_startup(tmp_path, monkeypatch):
+    """Test that a malformed classes file fails load_game_data, not New Game"""
+    import main
+    from custom_exceptions import InvalidDataFormatError
+    bad_file = tmp_path / "classes.txt"
+    bad_file.write_text("CLASS_ID: Bard\nHEALTH: lots\nSTRENGTH: 1\nMAGIC: 1\nGOLD: 1\n")
+    try:
+        with monkeypatch.context() as patch:
+            patch.setattr(character_manager, "CLASSES_FILENAME", str(bad_file))
+            with pytest.raises(InvalidDataFormatError):
+                main.load_game_data()
+    finally:
+        character_manager.load_class_prototypes()
+
+def test_character_dirty_tracking(tmp_path):
+    """Test that unchanged characters are not rewritten"""
+    save_dir = str(tmp_path)
+    char = character_manager.create_character("DirtyTest", "Rogue")
+    
+    assert character_manager.save_character_if_dirty(char, save_dir) == True
+    assert character_manager.save_character_if_dirty(char, save_dir) == False
+    
+    char['inventory'].append("health_potion")
+    assert character_manager.is_character_dirty(char, save_dir)
+    assert character_manager.save_character_if_dirty(char, save_dir) == True
+    
+    loaded = character_manager.load_character("DirtyTest", save_dir)
+    assert not character_manager.is_character_dirty(loaded, save_dir)
+
+def test_change_log_save_mode(tmp_path):
+    """Test that log mode appends changes and load replays snapshot + log"""
+    save_dir = str(tmp_path)
+    character_manager.configure_save_directory(save_dir, mode="log")
+    
+    char = character_manager.create_character("LogTest", "Mage")
+    character_manager.save_character(char, save_dir)
+    
+    char['gold'] -= 25
+    char['inventory'].append("health_potion")
+    char['active_quests'].append("first_steps")
+    character_manager.save_character(char, save_dir)
+    
+    log_text = (tmp_path / "LogTest_save.log").read_text()
+    assert "ADD GOLD -25" in log_text
+    assert "APPEND INVENTORY health_potion" in log_text
+    
+    # A torn final record (crash mid-append) is ignored
+    with open(tmp_path / "LogTest_save.log", "a") as f:
+        f.write("ADD GOLD 99")
+    
+    loaded = character_manager.load_character("LogTest", save_dir)
+    assert loaded['gold'] == 75
+    assert loaded['inventory'] == ["health_potion"]
+    assert loaded['active_quests'] == ["first_steps"]
+    
+    # A log written with \r\n line endings keeps every whole record when trimmed
+    crlf_log = log_text.replace("\n", "\r\n").encode()
+    (tmp_path / "LogTest_save.log").write_bytes(crlf_log + b"ADD GOLD 99")
+    assert character_manager.load_character("LogTest", save_dir)['gold'] == 75
+    assert (tmp_path / "LogTest_save.log").read_bytes() == crlf_log
+    
+    character_manager.compact_character_log(loaded, save_dir)
+    assert not (tmp_path / "LogTest_save.log").exists()
+    assert character_manager.load_character("LogTest", save_dir)['gold'] == 75
+
+def test_sqlite_save_backend_and_migration(tmp_path):
+    """Test migrating text saves into SQLite and using the same save API"""
+    save_dir = str(tmp_path)
+    hero = character_manager.create_character("SqlHero", "Warrior")
+    hero['inventory'] = ["iron_sword", "health_potion"]
+    character_manager.save_character(hero, save_dir)
+    
+    assert character_manager.migrate_text_saves_to_sqlite(save_dir) == 1
+    assert (tmp_path / "saves.db").exists()
+    
+    loaded = character_manager.load_character("SqlHero", save_dir)
+    assert loaded['inventory'] == ["iron_sword", "health_potion"]
+    
+    mage = character_manager.create_character("SqlMage", "Mage")
+    character_manager.save_character(mage, save_dir)
+    assert character_manager.list_saved_characters(save_dir) == ["SqlHero", "SqlMage"]
+    
+    character_manager.delete_character("SqlMage", save_dir)
+    from custom_exceptions import CharacterNotFoundError
+    with pytest.raises(CharacterNotFoundError):
+        character_manager.load_character("SqlMage", save_dir)
+    character_manager.close_save_stores()
+
+def test_binary_save_format(tmp_path):
+    """Test binary saves round-trip and are detected automatically on load"""
+    save_dir = str(tmp_path)
+    char = character_manager.create_character("BinaryTest", "Cleric")
+    char['inventory'] = ["health_potion", "iron_sword"]
+    char['completed_quests'] = ["first_steps"]
+    character_manager.save_character(char, save_dir)
+    
+    character_manager.configure_save_directory(save_dir, format="binary")
+    char['gold'] = 5000
+    character_manager.save_character(char, save_dir)
+    
+    assert (tmp_path / "BinaryTest_save.bin").read_bytes().startswith(b"QCSB")
+    assert not (tmp_path / "BinaryTest_save.txt").exists()
+    
+    loaded = character_manager.load_character("BinaryTest", save_dir)
+    assert loaded == char
+    assert character_manager.list_saved_characters(save_dir) == ["BinaryTest"]
+
+def test_bulk_character_operations(tmp_path):
+    """Test parallel bulk save/load and transforming every save"""
+    save_dir = str(tmp_path)
+    chars = [character_manager.create_character(f"Bulk{i}", "Rogue") for i in range(20)]
+    character_manager.save_characters(chars, save_dir, workers=4)
+    
+    names = [c['name'] for c in chars]
+    loaded = character_manager.load_characters(names, save_dir, workers=4)
+    assert [c['name'] for c in loaded] == names
+    
+    seen = []
+    changed, errors = character_manager.transform_all_characters(
+        lambda c: character_manager.add_gold(c, 500), save_dir, workers=4,
+        progress=lambda done, total: seen.append((done, total)))
+    assert (changed, errors) == (20, [])
+    assert seen[-1] == (20, 20)
+    assert all(c['gold'] == 600 for c in character_manager.load_characters(names, save_dir))
+
+def test_save_manifest_listing(tmp_path):
+    """Test the manifest stays in sync with saves and rebuilds after drift"""
+    save_dir = str(tmp_path)
+    for name, char_class, gold in [("Zed", "Mage", 10), ("Amy", "Warrior", 300)]:
+        char = character_manager.create_character(name, char_class)
+        char['gold'] = gold
+        character_manager.save_character(char, save_dir)
+    
+    # First listing builds the manifest, later saves keep it fresh
+    summaries = character_manager.list_character_summaries(save_dir)
+    assert [s['name'] for s in summaries] == ["Amy", "Zed"]
+    
+    rich = character_manager.load_character("Zed", save_dir)
+    rich['gold'] = 999
+    character_manager.save_character(rich, save_dir)
+    character_manager.delete_character("Amy", save_dir)
+    assert character_manager.is_manifest_fresh(save_dir)
+    assert character_manager.list_character_summaries(save_dir) == [
+        {'name': 'Zed', 'class': 'Mage', 'level': 1, 'gold': 999}]
+    
+    # A save file copied in behind the manifest's back is picked up
+    bob = character_manager.load_character("Zed", save_dir)
+    bob.update(name="Bob", gold=5)
+    bob_save = character_manager.encode_text_save(bob)
+    (tmp_path / "Bob_save.txt").write_bytes(bob_save)
+    by_gold = character_manager.list_character_summaries(save_dir, sort_by="gold")
+    assert [s['name'] for s in by_gold] == ["Bob", "Zed"]
+
+def test_save_checksums_and_verification(tmp_path):
+    """Test that damaged saves are refused on load and reported by verify_saves"""
+    save_dir = str(tmp_path)
+    for name in ["Good", "Flipped", "Cut", "Legacy"]:
+        character_manager.save_character(character_manager.create_character(name, "Rogue"), save_dir)
+    character_manager.configure_save_directory(save_dir, format="binary")
+    character_manager.save_character(character_manager.create_character("BinCut", "Mage"), save_dir)
+    
+    flipped = (tmp_path / "Flipped_save.txt").read_text().replace("GOLD: 100", "GOLD: 900")
+    (tmp_path / "Flipped_save.txt").write_text(flipped)
+    cut = (tmp_path / "Cut_save.txt").read_text()
+    (tmp_path / "Cut_save.txt").write_text(cut[:-4])
+    (tmp_path / "BinCut_save.bin").write_bytes((tmp_path / "BinCut_save.bin").read_bytes()[:30])
+    # A save from before checksums: accepted, but still checked by parsing
+    legacy = (tmp_path / "Legacy_save.txt").read_text().split("CHECKSUM")[0]
+    (tmp_path / "Legacy_save.txt").write_text(legacy.replace("LEVEL: 1", "LEVEL: one"))
+    
+    # A hand-written save from before checksums without a final newline
+    unsigned = character_manager.encode_text_save(character_manager.create_character("Old", "Mage"))
+    (tmp_path / "Old_save.txt").write_bytes(unsigned.split(b"CHECKSUM")[0].rstrip(b"\n"))
+    
+    from custom_exceptions import SaveFileCorruptedError
+    with pytest.raises(SaveFileCorruptedError):
+        character_manager.load_character("Flipped", save_dir)
+    with pytest.raises(SaveFileCorruptedError, match="truncated"):
+        character_manager.load_character("Cut", save_dir)
+    assert character_manager.load_character("Good", save_dir)['name'] == "Good"
+    assert character_manager.load_character("Old", save_dir)['name'] == "Old"
+    # The checksum covers the exact bytes on disk
+    good = character_manager.load_character("Good", save_dir)
+    assert (tmp_path / "Good_save.txt").read_bytes() == character_manager.encode_text_save(good)
+    
+    checked, problems = character_manager.verify_saves(save_dir, workers=2)
+    assert checked == 6
+    assert sorted((f, p) for f, p, m in problems) == [
+        ("BinCut_save.bin", "truncated"), ("Cut_save.txt", "truncated"),
+        ("Flipped_save.txt", "corrupt"), ("Legacy_save.txt", "invalid")]
+
+def test_background_save_writer(tmp_path):
+    """Test that queued saves coalesce and flush() waits for them"""
+    save_dir = str(tmp_path)
+    writer = character_manager.SaveWriter(save_dir)
+    char = character_manager.create_character("AsyncTest", "Mage")
+    
+    for gold in range(100, 150):
+        char['gold'] = gold
+        writer.submit(char)
+    assert writer.submit(char) == False  # Same state as the last submit
+    
+    char['gold'] = 9999  # Changes after submit do not leak into the queued snapshot
+    assert writer.flush() == []
+    assert writer.writes <= 50
+    assert character_manager.load_character("AsyncTest", save_dir)['gold'] == 149
+    writer.close()
+
+def test_group_commit_saves(tmp_path):
+    """Test that batched saves only appear once the group commits"""
+    save_dir = str(tmp_path)
+    chars = [character_manager.create_character(f"Group{i}", "Warrior") for i in range(10)]
+    
+    with character_manager.group_commit():
+        for char in chars:
+            character_manager.save_character(char, save_dir)
+        assert not (tmp_path / "Group0_save.txt").exists()
+    
+    assert list(tmp_path.glob("*.tmp")) == []
+    assert len(character_manager.load_characters([c['name'] for c in chars], save_dir)) == 10
+    
+    writer = character_manager.SaveWriter(save_dir, group_commit_window=0.05)
+    for char in chars:
+        char['gold'] = 42
+        writer.submit(char)
+    assert writer.flush() == []
+    assert all(c['gold'] == 42 for c in character_manager.load_characters([c['name'] for c in chars], save_dir))
+    writer.close()
+
+def test_group_commit_repeated_saves(tmp_path, monkeypatch):
+    """Test saving one character twice in a batch, including a log compaction"""
+    save_dir = str(tmp_path)
+    a = character_manager.create_character("Twice", "Mage")
+    b = character_manager.create_character("Other", "Rogue")
+    
+    with character_manager.group_commit():
+        character_manager.save_character(a, save_dir)
+        a['gold'] = 7
+        character_manager.save_character(a, save_dir)
+        character_manager.save_character(b, save_dir)
+    
+    assert list(tmp_path.glob("*.tmp")) == []
+    assert character_manager.load_character("Twice", save_dir)['gold'] == 7
+    assert character_manager.load_character("Other", save_dir)['name'] == "Other"
+    
+    # An append queued for fsync, then the log removed by a compaction
+    monkeypatch.setattr(character_manager, "LOG_COMPACT_THRESHOLD", 3)
+    character_manager.configure_save_directory(save_dir, mode="log")
+    with character_manager.group_commit():
+        for gold in range(10, 16):
+            b['gold'] = gold
+            character_manager.save_character(b, save_dir)
+    assert character_manager.load_character("Other", save_dir)['gold'] == 15
+
 def test_character_leveling_system():
     """Test that character leveling works correctly"""
     char = character_manager.create_character("LevelTest", "Mage")
@@ -54,6 +356,53 @@ def test_character_leveling_system():
     assert char['max_health'] > original_health
     assert char['health'] == char['max_health']  # Health restored on level up
 
+def test_large_experience_grant():
+    """Test that one big XP grant levels up in one step and notifies listeners"""
+    char = character_manager.create_character("BigXP", "Rogue")
+    events = []
+    listener = lambda character, old, new: events.append((old, new))
+    character_manager.add_level_up_listener(listener)
+    try:
+        # Levels 1-99 cost 100 * (1 + ... + 99) = 495000 XP
+        character_manager.gain_experience(char, 495000 + 42)
+    finally:
+        character_manager.remove_level_up_listener(listener)
+    
+    assert (char['level'], char['experience']) == (100, 42)
+    assert char['strength'] == 12 + 2 * 99
+    assert events == [(1, 100)]
+    
+    char['experience'] = 10 ** 12  # Far past the precomputed table
+    assert character_manager.apply_level_ups(char) == 141421 - 100
+    assert char['experience'] < char['level'] * 100
+
+def test_character_table_updates():
+    """Test that CharacterTable applies the single-character rules to every row"""
+    chars = [character_manager.create_character(f"Row{i}", "Warrior") for i in range(4)]
+    chars[3]['health'] = 0
+    table = character_manager.CharacterTable(chars)
+    
+    assert list(table.gain_experience([50, 100, 300, 500])) == [0, 1, 2, 0]
+    assert list(table.level) == [1, 2, 3, 1]
+    assert list(table.experience) == [50, 0, 0, 0]  # Dead characters gain nothing
+    
+    table.health[0] = 100
+    assert list(table.heal([True, False, False, True], 50)) == [20, 0, 0, 0]
+    assert table.revive_dead() == 1
+    
+    with pytest.raises(ValueError):
+        table.add_gold([0, 0, 0, -101])
+    for bad_call in (lambda: table.heal([True], 5), lambda: table.gain_experience([10] * 5),
+                     lambda: table.add_gold([1, 2])):
+        with pytest.raises(ValueError):
+            bad_call()
+    assert len(table.health) == len(table.experience) == len(table.gold) == 4
+    table.add_gold([1, 2, 3, 4])
+    
+    rows = table.to_characters()
+    assert rows[2]['max_health'] == 140 and rows[2]['strength'] == 19
+    assert rows[3]['health'] == 60 and rows[3]['gold'] == 104
+
 def test_character_gold_management():
     """Test adding and spending gold"""
     char = character_manager.create_character("GoldTest", "Rogue")
@@ -89,6 +438,17 @@ def test_inventory_item_management():
     assert "health_potion" not in char['inventory']  # Consumed
     assert char['health'] == 70  # Healed
 
+def test_precompiled_item_effects():
+    """Test that loaded items carry a compiled effect used by use_item"""
+    items = game_data.load_items("data/items.txt")
+    assert items['health_potion']['compiled_effect'] == ('health', 20)
+    
+    char = character_manager.create_character("EffectTest", "Cleric")
+    char['health'] = 50
+    inventory_system.add_item_to_inventory(char, "health_potion")
+    inventory_system.use_item(char, "health_potion", items['health_potion'])
+    assert char['health'] == 70
+
 def test_equipment_system():
     """Test equipping weapons and armor"""
     char = character_manager.create_character("EquipTest", "Warrior")
@@ -123,6 +483,22 @@ def test_shop_system():
     assert gold_received == 12  # Half of cost (25 // 2)
     assert "health_potion" not in char['inventory']
 
+def test_shop_catalog_queries():
+    """Test filtering the columnar shop view by type and price"""
+    items = game_data.load_items("data/items.txt")
+    catalog = inventory_system.ShopCatalog(items)
+    
+    weapons = catalog.query("weapon", 200)
+    assert weapons == sorted((i for i in items if items[i]['type'] == 'weapon' and items[i]['cost'] <= 200),
+                             key=lambda i: items[i]['cost'])
+    
+    affordable = catalog.query(max_cost=100)
+    assert all(items[i]['cost'] <= 100 for i in affordable)
+    assert catalog.count(max_cost=100) == len(affordable)
+    
+    # Pagination returns consecutive slices
+    assert catalog.query(offset=0, limit=3) + catalog.query(offset=3, limit=100) == catalog.query()
+
 # ============================================================================
 # QUEST INTEGRATION TESTS
 # ============================================================================
@@ -187,6 +563,18 @@ def test_quest_prerequisite_system():
     quest_handler.accept_quest(char, 'second_quest', quests)
     assert 'second_quest' in char['active_quests']
 
+def test_indexed_available_quests():
+    """Test that the quest index gives the same answer as the full scan"""
+    quests = game_data.load_quests("data/quests.txt")
+    index = quest_handler.build_quest_index(quests)
+    char = character_manager.create_character("IndexTest", "Warrior")
+    
+    for level, completed in [(1, []), (2, ['first_steps']), (5, ['first_steps', 'goblin_hunter'])]:
+        char['level'] = level
+        char['completed_quests'] = completed
+        expected = quest_handler.get_available_quests(char, quests)
+        assert quest_handler.get_available_quests(char, quests, index) == expected
+
 # ============================================================================
 # COMBAT INTEGRATION TESTS
 # ============================================================================
@@ -204,6 +592,69 @@ def test_combat_system_basic_battle():
     assert battle.character == char
     assert battle.enemy == enemy
 
+def test_headless_battles(capsys):
+    """Test policy-driven battles that need no terminal"""
+    import random
+    warrior = character_manager.create_character("Bot", "Warrior")
+    orc = combat_system.create_enemy("orc")
+    
+    messages = []
+    result = combat_system.simulate_battle(warrior, orc, combat_system.AlwaysAttackPolicy(),
+                                           output=messages.append)
+    # Warrior hits for 15 - 12 // 4 = 12, the orc for 12 - 15 // 4 = 9
+    assert result['winner'] == 'player'
+    assert result['turns'] == 7
+    assert (result['damage_dealt'], result['damage_taken']) == (80, 54)
+    assert messages[0].startswith("Battle started")
+    assert warrior['health'] == 120 and orc['health'] == 80  # Originals untouched
+    
+    rogue = character_manager.create_character("Rolls", "Rogue")
+    runs = [combat_system.simulate_battle(rogue, orc, combat_system.AbilityFirstPolicy(), random.Random(7))
+            for _ in range(2)]
+    assert runs[0] == runs[1]  # Same seed, same battle
+    
+    scripted = combat_system.ScriptedPolicy([combat_system.ABILITY, combat_system.RUN], loop=True)
+    dragon = combat_system.create_enemy("dragon")
+    result = combat_system.simulate_battle(warrior, dragon, scripted, random.Random(1), max_turns=1)
+    assert (result['winner'], result['damage_dealt']) == ('draw', 30)
+    assert capsys.readouterr().out == ""  # Headless battles print nothing
+
+def test_batch_battle_simulator():
+    """Test that lockstep batch battles follow the same rules as SimpleBattle"""
+    chars = character_manager.create_characters(
+        [(f"B{i}", cls) for i, cls in enumerate(["Warrior", "Mage", "Cleric"] * 3)])
+    enemies = [combat_system.create_enemy(e) for e in ["goblin"] * 3 + ["orc"] * 3 + ["dragon"] * 3]
+    codes = {'player': combat_system.PLAYER_WON, 'enemy': combat_system.ENEMY_WON, 'draw': combat_system.DRAW}
+    
+    for action, policy in [(combat_system.ATTACK, combat_system.AlwaysAttackPolicy()),
+                           (combat_system.ABILITY, combat_system.AbilityFirstPolicy())]:
+        batch = combat_system.simulate_battles(chars, enemies, action, max_turns=30)
+        for i, (char, enemy) in enumerate(zip(chars, enemies)):
+            single = combat_system.simulate_battle(char, enemy, policy, max_turns=30)
+            assert batch['winner'][i] == codes[single['winner']]
+            assert batch['turns'][i] == single['turns']
+            assert batch['character_health'][i] == char['health'] - single['damage_taken'] + single['healing']
+    
+    assert chars[0]['health'] == 120  # Inputs are not changed
+    with pytest.raises(ValueError):
+        combat_system.simulate_battles(chars, enemies, combat_system.RUN)
+
+def test_balance_harness_is_reproducible():
+    """Test that sweep results do not depend on the number of workers"""
+    import balance_harness
+    args = dict(levels=[2, 3], battles=3000, seed=5, classes=["Rogue"], enemy_types=["orc", "dragon"])
+    serial = balance_harness.run_balance_sweep(workers=1, **args)
+    parallel = balance_harness.run_balance_sweep(workers=2, **args)
+    assert serial == parallel
+    assert [(s['enemy'], s['level']) for s in serial] == [("orc", 2), ("orc", 3), ("dragon", 2), ("dragon", 3)]
+    assert all(s['win_low'] <= s['win_rate'] <= s['win_high'] for s in serial)
+    
+    with pytest.raises(ValueError):
+        balance_harness.run_balance_sweep([1], battles=0, workers=1)
+    
+    low, high = balance_harness.wilson_interval(50, 100)
+    assert round(low, 3) == 0.404 and round(high, 3) == 0.596
+
 def test_combat_victory_rewards():
     """Test that winning combat grants rewards"""
     char = character_manager.create_character("RewardTest", "Mage")
@@ -274,6 +725,95 @@ def test_data_validation():
     
     assert game_data.validate_item_data(valid_item) == True
 
+def test_streaming_data_loaders():
+    """Test that iter_quests/iter_items yield the same data as load_*"""
+    quest_iter = game_data.iter_quests("data/quests.txt")
+    first = next(quest_iter)
+    assert first['quest_id'] == 'first_steps'
+    
+    quests = game_data.load_quests("data/quests.txt")
+    streamed = [first] + list(quest_iter)
+    assert [q['quest_id'] for q in streamed] == list(quests.keys())
+    
+    items = game_data.load_items("data/items.txt")
+    assert [i['item_id'] for i in game_data.iter_items("data/items.txt")] == list(items.keys())
+
+def test_compiled_data_cache(tmp_path):
+    """Test that the compiled cache is used when fresh and rebuilt when stale"""
+    quest_file = tmp_path / "quests.txt"
+    quest_file.write_text(open("data/quests.txt").read())
+    
+    quests = game_data.load_quests_cached(str(quest_file))
+    assert (tmp_path / ".cache" / "quests.bin").exists()
+    assert game_data.load_quests_cached(str(quest_file)) == quests
+    
+    # Changing the source makes the cache stale
+    quest_file.write_text("QUEST_ID: only\nTITLE: Only\nDESCRIPTION: x\nREWARD_XP: 1\n"
+                          "REWARD_GOLD: 1\nREQUIRED_LEVEL: 1\nPREREQUISITE: NONE\n")
+    assert list(game_data.load_quests_cached(str(quest_file)).keys()) == ['only']
+
+def test_lazy_item_catalog():
+    """Test that the memory-mapped catalog matches load_items and works with the shop"""
+    items = game_data.load_items("data/items.txt")
+    
+    with game_data.ItemCatalog("data/items.txt") as catalog:
+        assert len(catalog) == len(items)
+        assert list(catalog) == list(items)
+        assert 'health_potion' in catalog
+        assert catalog['health_potion'] == items['health_potion']
+        assert catalog.get('missing_item') is None
+        
+        char = character_manager.create_character("CatalogTest", "Mage")
+        inventory_system.purchase_item(char, 'health_potion', catalog['health_potion'])
+        assert char['gold'] == 100 - items['health_potion']['cost']
+
+def test_lazy_item_catalog_error_line(tmp_path):
+    """Test that a bad item found on lookup reports its line number"""
+    items_file = tmp_path / "items.txt"
+    items_file.write_text("ITEM_ID: ok\nNAME: Ok\nTYPE: consumable\nEFFECT: health:5\nCOST: 1\nDESCRIPTION: Fine\n\n\n"
+                          "ITEM_ID: bad\nNAME: Bad\nTYPE: consumable\nEFFECT: health:5\nCOST: lots\nDESCRIPTION: Broken\n")
+    from custom_exceptions import InvalidDataFormatError
+    with game_data.ItemCatalog(str(items_file)) as catalog:
+        assert catalog['ok']['cost'] == 1
+        with pytest.raises(InvalidDataFormatError, match=r"items.txt:13: COST"):
+            catalog['bad']
+
+def test_data_file_hot_reload(tmp_path):
+    """Test that the watcher patches only changed blocks in place"""
+    item_file = tmp_path / "items.txt"
+    item_file.write_text(open("data/items.txt").read())
+    items = game_data.load_items(str(item_file))
+    untouched = items['iron_sword']
+    
+    watcher = game_data.DataFileWatcher(str(item_file), items, "item")
+    assert watcher.poll() == False
+    
+    text = item_file.read_text().replace("COST: 25\n", "COST: 30\n", 1)
+    item_file.write_text(text + "\nITEM_ID: new_item\nNAME: New\nTYPE: consumable\n"
+                         "EFFECT: health:1\nCOST: 1\nDESCRIPTION: New item\n")
+    
+    assert watcher.poll() == True
+    assert watcher.generation == 1
+    assert items['health_potion']['cost'] == 30
+    assert 'new_item' in items
+    assert items['iron_sword'] is untouched  # Unchanged blocks are not re-parsed
+
+def test_sharded_data_directory(tmp_path):
+    """Test loading a directory of shards in parallel and duplicate detection"""
+    blocks = open("data/quests.txt").read().strip().split("\n\n")
+    shard_dir = tmp_path / "quests.d"
+    shard_dir.mkdir()
+    (shard_dir / "a.txt").write_text("\n\n".join(blocks[:3]))
+    (shard_dir / "b.txt").write_text("\n\n".join(blocks[3:]))
+    
+    quests = game_data.load_quests(str(shard_dir), workers=2)
+    assert quests == game_data.load_quests("data/quests.txt")
+    
+    from custom_exceptions import InvalidDataFormatError
+    (shard_dir / "c.txt").write_text(blocks[0])
+    with pytest.raises(InvalidDataFormatError):
+        game_data.load_quests(str(shard_dir), workers=2)
+
 # ============================================================================
 # FULL GAME WORKFLOW TEST
 # ============================================================================